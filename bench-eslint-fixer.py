@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Benchmark for fix-eslint-errors.py
+Generates a synthetic TSX/TS corpus and measures each fixer and the full pipeline
+"""
+
+import argparse
+import importlib.util
+import json
+import random
+import resource
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+FIXER_SCRIPT = Path(__file__).with_name('fix-eslint-errors.py')
+
+def load_fixer():
+    """Import fix-eslint-errors.py (its name is not a valid module name)"""
+    spec = importlib.util.spec_from_file_location('fix_eslint_errors', FIXER_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    # Registered so worker processes can unpickle its functions
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+# Lines that trip one of the fixers, by kind of file they can appear in
+TSX_VIOLATIONS = [
+    "      <p>Don't forget your \"programme\" review</p>",
+    '  const data: any = fetchData()',
+    '  let fid = 0',
+    "  const chalk = require('chalk')",
+    '  useEffect(() => {\n    load()\n  }, [])',
+]
+TS_VIOLATIONS = [
+    '  const payload: any = await request.json()',
+    '  const items = <any>cache.get(key)',
+    "  const { join } = require('path')",
+    '  let shifts = []',
+]
+CLEAN_LINES = [
+    '  const total = items.reduce((sum, item) => sum + item.value, 0)',
+    '  // Keep the layout stable while images load',
+    "  const label = `${user.firstName} ${user.lastName}`",
+    '  if (isOpen && total > 3) setOpen(false)',
+    "      <span className=\"text-sm text-gray-500\">{formatDate(date)}</span>",
+]
+
+def _synthetic_tsx(rng, lines, density):
+    body = []
+    for _ in range(lines):
+        body.append(rng.choice(TSX_VIOLATIONS) if rng.random() < density else rng.choice(CLEAN_LINES))
+    return (
+        "'use client'\n\n"
+        "import { useEffect, useState } from 'react'\n"
+        "import { Calendar, Clock } from 'lucide-react'\n\n"
+        'export default function Component() {\n'
+        '  const [open, setOpen] = useState(false)\n'
+        + '\n'.join(body) +
+        '\n  return (\n    <div>\n'
+        "      <h2>Who it's for</h2>\n"
+        '    </div>\n  )\n}\n'
+    )
+
+def _synthetic_ts(rng, lines, density):
+    body = []
+    for _ in range(lines):
+        body.append(rng.choice(TS_VIOLATIONS) if rng.random() < density else rng.choice(CLEAN_LINES[:4]))
+    return (
+        "import { NextRequest, NextResponse } from 'next/server'\n"
+        "import type { request } from './types'\n\n"
+        'export async function POST(req: NextRequest) {\n'
+        + '\n'.join(body) +
+        '\n  return NextResponse.json({ ok: true })\n}\n'
+    )
+
+def generate_corpus(directory, files=200, lines=300, density=0.05, seed=0):
+    """Write a synthetic corpus and return its file paths relative to ``directory``
+
+    Roughly a third of the files are API routes under app/api/ (so the
+    unused-import table applies to them); the rest are components.
+    ``density`` is the chance that any body line is a violation.
+    """
+    rng = random.Random(seed)
+    directory = Path(directory)
+    paths = []
+    for i in range(files):
+        if i % 3 == 2:
+            path = f'app/api/bench-{i}/route.ts'
+            content = _synthetic_ts(rng, lines, density)
+        else:
+            path = f'components/Bench{i}.tsx'
+            content = _synthetic_tsx(rng, lines, density)
+        (directory / path).parent.mkdir(parents=True, exist_ok=True)
+        (directory / path).write_text(content, encoding='utf-8')
+        paths.append(path)
+    return paths
+
+def measure(func, repeat):
+    """Best wall time over ``repeat`` runs plus the traced peak of the first"""
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, peak
+
+def _rates(seconds, files, size, peak):
+    return {
+        'seconds': round(seconds, 6),
+        'files_per_sec': round(files / seconds, 1) if seconds else None,
+        'mb_per_sec': round(size / 1e6 / seconds, 2) if seconds else None,
+        'peak_kib': round(peak / 1024, 1),
+    }
+
+def run_benchmark(fixer, root, paths, repeat=3, jobs=1):
+    contents = [(path, (root / path).read_text(encoding='utf-8')) for path in paths]
+    size = sum(len(content.encode('utf-8')) for _, content in contents)
+    results = {'fixers': {}}
+
+    print("\n⏱️ Individual fixers (in memory):")
+    for name, entry in fixer.FIXERS.items():
+        def run_one(apply=entry.apply):
+            for path, content in contents:
+                # Each fixer pays for its own lexing and line index
+                fixer.clear_source_cache()
+                apply(content, path)
+        seconds, peak = measure(run_one, repeat)
+        results['fixers'][name] = _rates(seconds, len(contents), size, peak)
+        print(f"  - {name:<20} {seconds * 1000:9.1f} ms  {results['fixers'][name]['mb_per_sec']} MB/s")
+
+    print("\n⏱️ Full process_file() pipeline (read + all fixers, nothing written):")
+    targets = [(path, None) for path in paths]
+
+    def run_pipeline():
+        fixer.clear_source_cache()
+        for result in fixer.run_files(root, targets, jobs, mode=fixer.DEFER):
+            if result.status == fixer.ERROR:
+                raise RuntimeError(f'{result.path}: {result.detail}')
+    seconds, peak = measure(run_pipeline, repeat)
+    results['pipeline'] = _rates(seconds, len(contents), size, peak)
+    results['pipeline']['jobs'] = jobs
+    print(f"  - {len(contents)} files in {seconds * 1000:.1f} ms: "
+          f"{results['pipeline']['files_per_sec']} files/s, {results['pipeline']['mb_per_sec']} MB/s")
+
+    results['max_rss_kib'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"\n💾 Peak traced memory {results['pipeline']['peak_kib']} KiB, max RSS {results['max_rss_kib']} KiB")
+    return results
+
+def compare(results, baseline, tolerance):
+    """Print throughput changes against a baseline; returns the regressions"""
+    regressions = []
+    print(f"\n📊 Compared to baseline (tolerance {tolerance:.0%}):")
+    pairs = [(f'fixer {name}', stats, baseline.get('fixers', {}).get(name))
+             for name, stats in results['fixers'].items()]
+    pairs.append(('pipeline', results['pipeline'], baseline.get('pipeline')))
+    for label, stats, base in pairs:
+        if not base or not base.get('mb_per_sec') or not stats.get('mb_per_sec'):
+            print(f"  - {label}: no baseline")
+            continue
+        change = stats['mb_per_sec'] / base['mb_per_sec'] - 1
+        slower = change < -tolerance
+        if slower:
+            regressions.append(label)
+        print(f"  - {label}: {base['mb_per_sec']} → {stats['mb_per_sec']} MB/s ({change:+.1%}) {'⚠️' if slower else '✅'}")
+    return regressions
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark fix-eslint-errors.py on a synthetic corpus')
+    parser.add_argument('--files', type=int, default=200, help='number of files to generate (default: 200)')
+    parser.add_argument('--lines', type=int, default=300, help='body lines per file (default: 300)')
+    parser.add_argument('--density', type=float, default=0.05,
+                        help='chance that a body line is a violation (default: 0.05)')
+    parser.add_argument('--seed', type=int, default=0, help='random seed for the corpus (default: 0)')
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per measurement, best is kept (default: 3)')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='worker processes for the pipeline run (default: 1)')
+    parser.add_argument('--corpus', help='generate the corpus here and keep it (default: a temporary directory)')
+    parser.add_argument('--baseline', help='compare against results saved with --save-baseline')
+    parser.add_argument('--tolerance', type=float, default=0.10,
+                        help='allowed throughput drop before a result counts as a regression (default: 0.10)')
+    parser.add_argument('--save-baseline', metavar='PATH', help='write these results as JSON')
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    fixer = load_fixer()
+
+    root = Path(args.corpus) if args.corpus else Path(tempfile.mkdtemp(prefix='eslint-fixer-bench-'))
+    try:
+        paths = generate_corpus(root, args.files, args.lines, args.density, args.seed)
+        size = sum((root / path).stat().st_size for path in paths)
+        print("🏁 ESLint fixer benchmark")
+        print("=" * 50)
+        print(f"Corpus: {len(paths)} files, {size / 1e6:.2f} MB, density {args.density} ({root})")
+
+        results = run_benchmark(fixer, root, paths, args.repeat, args.jobs)
+        results['corpus'] = {'files': len(paths), 'lines': args.lines, 'density': args.density,
+                             'seed': args.seed, 'bytes': size}
+    finally:
+        if not args.corpus:
+            shutil.rmtree(root, ignore_errors=True)
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"\n💾 Baseline written to {args.save_baseline}")
+
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
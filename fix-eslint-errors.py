@@ -4,272 +4,1562 @@ Comprehensive ESLint Error Fixer for Leah Fowler Performance
 Fixes all categories of ESLint errors systematically
 """
 
-import re
+import argparse
+import cProfile
+import difflib
+import hashlib
+import heapq
+import json
+import marshal
+import mmap
 import os
+import re
+import stat
+import subprocess
+import sys
+import tempfile
+import time
+from bisect import bisect_right
+from collections import OrderedDict, namedtuple
+from contextlib import contextmanager, suppress
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property, lru_cache, partial
+from itertools import accumulate
 from pathlib import Path
 
-def fix_unescaped_entities(content):
-    """Fix react/no-unescaped-entities errors"""
-    # Replace apostrophes in JSX text
-    content = re.sub(r'(\>[^<]*?)\'([^<]*?\<)', r'\1&apos;\2', content)
-    # Replace quotes in JSX text
-    content = re.sub(r'(\>[^<]*?)"([^<]*?)"([^<]*?\<)', r'\1&ldquo;\2&rdquo;\3', content)
-    return content
+DEFAULT_ROOT = '/root/app/leah-fowler-performance'
 
-def fix_unused_imports(content, filename):
-    """Remove unused imports based on common patterns"""
-    lines = content.split('\n')
-    new_lines = []
-
-    # Common unused imports to remove
-    unused_patterns = {
-        'app/admin/assessments/page.tsx': ['Tabs', 'TabsContent', 'TabsList', 'TabsTrigger', 'AlertCircle', 'CheckCircle', 'Filter'],
-        'app/api/': ['request'],  # Remove unused request params in API routes
-        'app/blog/page.tsx': ['Calendar'],
-        'app/performance-accelerator/page.tsx': ['Target', 'CardHeader', 'CardTitle'],
-        'components/AboutSection.tsx': ['BookOpen', 'Briefcase', 'Globe', 'TrendingUp', 'BadgeCheck', 'Dumbbell', 'Activity', 'Brain', 'Shield', 'Image'],
-        'components/AphroditePricingTiers.tsx': ['Zap', 'Video', 'Clock'],
-        'components/AssessmentSection.tsx': ['ClipboardCheck'],
-        'components/AssessmentTool.tsx': ['Users', 'BarChart', 'Clock', 'Briefcase', 'Activity'],
-        'components/BarrierIdentificationSystem.tsx': ['useEffect', 'XCircle', 'Label'],
-        'components/ChatWidget.tsx': ['X', 'User', 'Badge', 'Card', 'Textarea'],
-        'components/ConsultancyProgrammes.tsx': ['Users', 'TrendingUp'],
-        'components/ContactSection.tsx': ['MessageSquare', 'Send', 'Sparkles'],
-        'components/Footer.tsx': ['Send', 'Sparkles', 'Globe', 'Clock', 'Calendar'],
-        'components/InteractiveProgrammeGallery.tsx': ['Calendar', 'Play'],
-        'components/MobileBottomNav.tsx': ['Home', 'ChevronUp'],
-        'components/MobileNav.tsx': ['User'],
-        'components/MobileOptimizedHero.tsx': ['Link'],
-        'components/NorfolkCommunitySection.tsx': ['Image', 'Star', 'Activity', 'Target'],
-        'components/PremiumFAQSection.tsx': ['seoOptimizedContent'],
-        'components/PremiumHeroWithImage.tsx': ['Link', 'Brain', 'TrendingUp', 'Shield', 'Activity', 'ChevronRight', 'CheckCircle', 'Star'],
-        'components/PremiumProgrammeComparison.tsx': ['easings'],
-        'components/PremiumSocialProof.tsx': ['easings'],
-        'components/PremiumTestimonialsSection.tsx': ['fadeInUp', 'luxuryScale', 'staggerContainer'],
-        'components/PricingTiers.tsx': ['Video', 'FileText'],
-        'components/ProgrammeRecommendationEngine.tsx': ['Heart', 'Smartphone', 'Video', 'Award', 'ChevronLeft', 'ChevronRight', 'Tabs', 'TabsContent', 'TabsList', 'TabsTrigger'],
-        'components/ProgrammesSection.tsx': ['Zap', 'Target', 'Users', 'Brain'],
-        'components/TestimonialsSection.tsx': ['Briefcase', 'Building'],
-        'components/TruthfulTrustSection.tsx': ['Clock', 'Star', 'Users'],
-        'components/VideoTestimonials.tsx': ['TrendingUp', 'Calendar'],
-    }
+# Per-file outcomes reported back by the workers
+FIXED = 'fixed'
+UNCHANGED = 'unchanged'
+CACHED = 'cached'
+ERROR = 'error'
+NOT_FOUND = 'not_found'
+
+FileResult = namedtuple('FileResult', 'path status detail digest diff content profile passes settled',
+                        defaults=(None,) * 7)
+
+# What process_file does with a changed file
+WRITE = 'write'
+DEFER = 'defer'
+DRY_RUN = 'dry_run'
+
+# When written files are flushed to disk (--fsync)
+FSYNC_POLICIES = ('never', 'file', 'end')
+
+# Files left at a fixed point are remembered here (relative to --root)
+CACHE_FILE = '.eslint-fixer-cache.json'
+
+# Files at least this big are memory-mapped instead of read into a buffer
+MMAP_THRESHOLD = 1 << 20
+
+# Cap on fixer passes per file with --converge
+MAX_PASSES = 10
+
+# Default directory for --cprofile dumps
+CPROFILE_DIR = 'eslint-fixer-profiles'
+
+# Any edit to this script (rules, tables, fixers) invalidates the cache
+RULES_VERSION = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+
+# List of files with errors (from ESLint output)
+FILES_WITH_ERRORS = [
+    'app/admin/assessments/page.tsx',
+    'app/api/assessment/admin/route.ts',
+    'app/api/assessment/gdpr/route.ts',
+    'app/api/assessment/submit/route.ts',
+    'app/api/lead-magnet/route.ts',
+    'app/api/performance-assessment/route.ts',
+    'app/blog/page.tsx',
+    'app/family-athlete-demo/page.tsx',
+    'app/mobile-demo/page.tsx',
+    'app/performance-accelerator/page.tsx',
+    'components/AboutSection.tsx',
+    'components/AphroditePricingTiers.tsx',
+    'components/AssessmentSection.tsx',
+    'components/AssessmentTool.tsx',
+    'components/BarrierIdentificationSystem.tsx',
+    'components/ChatWidget.tsx',
+    'components/ConsultancyProgrammes.tsx',
+    'components/ContactSection.tsx',
+    'components/ExitIntentPopup.tsx',
+    'components/FamilyTransformationTestimonials.tsx',
+    'components/FloatingElements.tsx',
+    'components/Footer.tsx',
+    'components/HeroStatsSection.tsx',
+    'components/InteractiveProgrammeGallery.tsx',
+    'components/LeadMagnetDelivery.tsx',
+    'components/LoadingStates.tsx',
+    'components/MobileBottomNav.tsx',
+    'components/MobileNav.tsx',
+    'components/MobileOptimizedHero.tsx',
+    'components/NorfolkCommunitySection.tsx',
+    'components/OptimizedImage.tsx',
+    'components/PackageSelectorQuiz.tsx',
+    'components/PerformanceBreakthroughLeadMagnet.tsx',
+    'components/PremiumFAQSection.tsx',
+    'components/PremiumHeroSection.tsx',
+    'components/PremiumHeroWithImage.tsx',
+    'components/PremiumProgrammeComparison.tsx',
+    'components/PremiumSocialProof.tsx',
+    'components/PremiumTestimonialsSection.tsx',
+    'components/PricingTiers.tsx',
+    'components/ProgrammeRecommendationEngine.tsx',
+    'components/ProgrammesSection.tsx',
+    'components/SectionErrorBoundary.tsx',
+    'components/SocialProofNotifications.tsx',
+    'components/TestimonialsSection.tsx',
+    'components/TruthfulTrustSection.tsx',
+    'components/VideoTestimonials.tsx',
+    'components/WhyChooseSection.tsx',
+    'components/spacing/SpacingShowcase.tsx',
+    'content/emails/nurture-sequence.ts',
+    'content/schema-markup.ts',
+    'hooks/useResponsive.ts',
+    'lib/animations.ts',
+    'lib/api-client.ts',
+    'lib/assessment-questions.ts',
+    'lib/assessment-scoring.ts',
+    'tests/comprehensive-ui-validation.spec.ts',
+    'tests/forum.test.ts',
+    'tests/mobile-experience.spec.ts',
+    'tests/mother-identity-transformation.spec.ts',
+    'tests/performance-accelerator.spec.ts',
+    'tests/screenshot-capture.spec.ts',
+    'tests/spacing-validation.spec.ts',
+    'tests/visual-validation.spec.ts',
+    'scripts/test-hero-performance.js',
+    'scripts/test-schema.js',
+    'tests/quick-demo-test.js',
+    'analyze-visual-issues.js',
+    'comprehensive-ui-analysis.mjs',
+    'test-spacing-validation.mjs',
+]
+
+NEWLINE = re.compile(r'\n')
+
+class LineIndex:
+    """Offsets where each line starts, for mapping positions to line numbers
+
+    Lines are numbered as in ``content.split('\\n')``, so a trailing
+    newline is followed by an empty last line.
+    """
+
+    def __init__(self, content):
+        self.length = len(content)
+        self.starts = [0]
+        self.starts.extend(match.end() for match in NEWLINE.finditer(content))
+
+    def line_of(self, pos):
+        """1-based line number of the character at ``pos``"""
+        return bisect_right(self.starts, pos)
+
+    def line_span(self, number):
+        """Start and end offsets of a line, the end including its newline"""
+        end = self.starts[number] if number < len(self.starts) else self.length
+        return self.starts[number - 1], end
+
+    def span_lines(self, match):
+        """First and last line a regex match covers"""
+        return self.line_of(match.start()), self.line_of(max(match.end() - 1, match.start()))
+
+class LineRanges:
+    """The 1-based, inclusive line ranges ESLint reported for one fixer"""
+
+    def __init__(self, ranges):
+        merged = []
+        for first, last in sorted(ranges):
+            if merged and first <= merged[-1][1] + 1:
+                merged[-1][1] = max(merged[-1][1], last)
+            else:
+                merged.append([first, last])
+        self.firsts = [first for first, _ in merged]
+        self.lasts = [last for _, last in merged]
+
+    def overlaps(self, first, last=None):
+        last = first if last is None else last
+        i = bisect_right(self.firsts, last) - 1
+        return i >= 0 and self.lasts[i] >= first
+
+    def __contains__(self, line):
+        return self.overlaps(line)
+
+    def shifted(self, before, after, edits):
+        """These ranges moved to where their lines are once ``edits`` are made
+
+        ``before`` and ``after`` are the LineIndex of the content and of the
+        edited result. Lines an edit replaces map onto its replacement, and
+        ranges whose lines were all removed are dropped.
+        """
+        starts = [start for start, _, _ in edits]
+        shifts = list(accumulate(len(replacement) - (end - start) for start, end, replacement in edits))
+
+        def move(pos, last):
+            i = bisect_right(starts, pos) - 1
+            if i < 0:
+                return pos
+            start, end, replacement = edits[i]
+            if pos >= end:
+                return pos + shifts[i]
+            new_start = start + (shifts[i - 1] if i else 0)
+            return new_start + len(replacement) - 1 if last else new_start
+
+        count = len(before.starts)
+        ranges = []
+        for first, last in zip(self.firsts, self.lasts):
+            if first > count:
+                break
+            last = min(last, count)
+            start, end = before.starts[first - 1], before.line_span(last)[1]
+            new_first = after.line_of(move(start, False))
+            new_last = after.line_of(move(max(end - 1, before.starts[last - 1]), True))
+            if new_first <= new_last:
+                ranges.append((new_first, new_last))
+        return LineRanges(ranges)
+
+    def __repr__(self):
+        return f'LineRanges({list(zip(self.firsts, self.lasts))})'
+
+# Token kinds reported by scan_source; anything not covered by a span is code
+STRING = 'string'
+TEMPLATE = 'template'
+COMMENT = 'comment'
+REGEX = 'regex'
+JSX_TEXT = 'jsx_text'
+CODE = 'code'
+
+# Most code is runs of identifiers, numbers and punctuation, which need no
+# span and of which only the last token (group 1) matters for what follows,
+# so a whole run up to the next string, comment, slash, `<` or backtick is
+# one match. Braces join the run at the top level, where nothing closes on
+# them. A template literal with no `${` is matched whole as well.
+_CODE_TOKEN = r"""
+    (?:\s*([A-Za-z_$][\w$]*|\d[\w.]*|=>|&&|\|\||\?\?|[^\s/'"`<%sA-Za-z_$\d]))+\s*
+  | \s+
+  | //[^\n]*
+  | /\*[\s\S]*?(?:\*/|\Z)
+  | '(?:[^'\\\n]|\\[\s\S])*'?
+  | "(?:[^"\\\n]|\\[\s\S])*"?
+  | `(?:[^`\\$]|\\[\s\S]|\$(?!\{))*`
+  | [\s\S]
+"""
+CODE_TOKEN = re.compile(_CODE_TOKEN % '{}', re.VERBOSE)
+TOP_CODE_TOKEN = re.compile(_CODE_TOKEN % '', re.VERBOSE)
+REGEX_LITERAL = re.compile(r'/(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[a-z]*')
+TEMPLATE_TEXT = re.compile(r'(?:[^`\\$]|\\[\s\S]|\$(?!\{))+')
+TAG_TOKEN = re.compile(r"""\s+|/>|"[^"]*"?|'[^']*'?|[^\s/>{"']+|[\s\S]""")
+JSX_CHILD_TEXT = re.compile(r'[^<{]+')
+CLOSING_TAG = re.compile(r'</[^>]*>?')
+JSX_TAG_START = re.compile(r'[A-Za-z_$>]')
+GENERIC_PARAMS = re.compile(r'\s*[A-Za-z_$][\w$]*\s*(?:,|extends\b)')
+# `<T>(item: T) => T` in a type is a generic function type, not an element.
+# The parameter list may span lines, so this looks at most
+# SIGNATURE_LOOKAHEAD characters ahead.
+GENERIC_SIGNATURE = re.compile(r'[A-Za-z_$][\w$]*>\s*\((?:[^()]|\([^()]*\))*\)\s*=>')
+SIGNATURE_LOOKAHEAD = 256
+
+# Tokens after which an expression (so a regex literal or JSX) can start
+EXPRESSION_KEYWORDS = {'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new', 'delete',
+                       'void', 'throw', 'instanceof', 'yield', 'await', 'default'}
+JSX_PRECEDERS = {None, '(', ',', '=', ':', '?', '[', '{', ';', '&&', '||', '??', '=>', '!'} | EXPRESSION_KEYWORDS
+REGEX_PRECEDERS = JSX_PRECEDERS | {'}', '+', '-', '*', '%', '<', '>', '&', '|', '^', '~'}
+
+# Lexer state at the start of a file: top-level code, no previous token
+INITIAL_STATE = ((('code', 0),), None)
+
+def _thaw(state):
+    """Mutable (stack, prev) to resume scanning from a frozen state"""
+    frames, prev = state
+    return [list(frame) for frame in frames], prev
+
+def _lex(content, jsx, pos, stack, prev, spans, marks, stop=None):
+    """The scan_source loop, from ``pos`` in the lexer state (stack, prev)
+
+    Spans are appended to ``spans``. After each code run or whitespace
+    with a line break in it, and at the start of each JSX text, the
+    position and frozen state are appended to ``marks`` (a pair of lists)
+    as a checkpoint a later scan can resume from. ``stop(pos, state)`` is
+    asked at every checkpoint and ends the scan when it returns true.
+    Returns the position the scan stopped at, or None if it reached the end.
+    """
+    positions, states = marks
+    n = len(content)
+    while pos < n:
+        frame = stack[-1]
+        mode = frame[0]
+
+        if mode == 'code':
+            match = (CODE_TOKEN if len(stack) > 1 else TOP_CODE_TOKEN).match(content, pos)
+            token, end = match.group(), match.end()
+            first = token[0]
+            if match.lastindex or first.isspace():
+                if match.lastindex:
+                    prev = match.group(1)
+                if '\n' in token:
+                    state = (tuple(map(tuple, stack)), prev)
+                    positions.append(end)
+                    states.append(state)
+                    if stop is not None and stop(end, state):
+                        return end
+            elif token.startswith(('//', '/*')):
+                spans.append((COMMENT, pos, end))
+            elif first in '\'"':
+                spans.append((STRING, pos, end))
+                prev = 'string'
+            elif first == '`':
+                if end - pos == 1:
+                    stack.append(['template', 0])
+                elif end - pos > 2:
+                    spans.append((TEMPLATE, pos + 1, end - 1))
+                prev = 'string'
+            elif first == '/' and prev in REGEX_PRECEDERS and REGEX_LITERAL.match(content, pos):
+                end = REGEX_LITERAL.match(content, pos).end()
+                spans.append((REGEX, pos, end))
+                prev = 'regex'
+            elif (first == '<' and jsx and prev in JSX_PRECEDERS and JSX_TAG_START.match(content, end)
+                    and not GENERIC_PARAMS.match(content, end)
+                    and not GENERIC_SIGNATURE.match(content, end, end + SIGNATURE_LOOKAHEAD)):
+                stack.append(['tag', 0])
+            elif first == '{':
+                frame[1] += 1
+                prev = '{'
+            elif first == '}':
+                if frame[1] == 0 and len(stack) > 1:
+                    stack.pop()  # closes a `${` or a JSX `{` container
+                else:
+                    frame[1] = max(frame[1] - 1, 0)
+                    prev = '}'
+            else:
+                prev = token
+            pos = end
+
+        elif mode == 'template':
+            if content[pos] == '`':
+                stack.pop()
+                pos += 1
+            elif content.startswith('${', pos):
+                stack.append(['code', 0])
+                prev = None
+                pos += 2
+            else:
+                end = TEMPLATE_TEXT.match(content, pos).end()
+                spans.append((TEMPLATE, pos, end))
+                pos = end
+
+        elif mode == 'tag':
+            match = TAG_TOKEN.match(content, pos)
+            token, end = match.group(), match.end()
+            if token == '/>':
+                stack.pop()  # self-closing element is complete
+                prev = ')'
+            elif token == '>':
+                frame[0] = 'children'
+            elif token == '{':
+                stack.append(['code', 0])
+                prev = None
+            elif token[0] in '\'"':
+                spans.append((STRING, pos, end))
+            elif token[0].isspace() and '\n' in token:
+                state = (tuple(map(tuple, stack)), prev)
+                positions.append(end)
+                states.append(state)
+                if stop is not None and stop(end, state):
+                    return end
+            pos = end
+
+        else:  # children
+            if content.startswith('</', pos):
+                pos = CLOSING_TAG.match(content, pos).end()
+                stack.pop()  # element is complete
+                prev = ')'
+            elif content[pos] == '<':
+                stack.append(['tag', 0])
+                pos += 1
+            elif content[pos] == '{':
+                stack.append(['code', 0])
+                prev = None
+                pos += 1
+            else:
+                state = (tuple(map(tuple, stack)), prev)
+                positions.append(pos)
+                states.append(state)
+                if stop is not None and stop(pos, state):
+                    return pos
+                end = JSX_CHILD_TEXT.match(content, pos).end()
+                spans.append((JSX_TEXT, pos, end))
+                pos = end
+    return None
+
+def scan_source(content, jsx=True):
+    """Split TS/TSX source into (kind, start, end) spans in a single pass
+
+    Strings, template text, comments, regex literals and JSX text each get
+    a span; whatever lies between spans is code (including JSX tag and
+    attribute names). Every regex used is anchored at the current position
+    and consumes one token or one run of plain code, so the scan is linear
+    in the size of the file. Brace, template and JSX nesting is tracked on
+    a stack.
+    """
+    return lex_source(content, jsx).spans
+
+def lex_source(content, jsx=True):
+    """TokenSpans for ``content``, with the checkpoints relex() resumes from"""
+    spans, marks = [], ([0], [INITIAL_STATE])
+    _lex(content, jsx, 0, *_thaw(INITIAL_STATE), spans, marks)
+    return TokenSpans(spans, marks)
+
+def apply_edits(content, edits):
+    """``content`` with each (start, end, replacement) of ``edits`` applied
+
+    Edits are in ascending order and do not overlap. ``content`` itself is
+    returned when there are none.
+    """
+    if not edits:
+        return content
+    pieces, last = [], 0
+    for start, end, replacement in edits:
+        pieces.append(content[last:start])
+        pieces.append(replacement)
+        last = end
+    pieces.append(content[last:])
+    return ''.join(pieces)
+
+# Checkpoints relex() backs up before an edit, beyond the one at or before
+# the line break. Past a line break the lexer looks ahead at most an
+# identifier and one more token (`<T\n,`, `<T\nextends`), which can hold at
+# most one checkpoint. The one longer look ahead, GENERIC_SIGNATURE, is
+# handled by resuming before any `<` it could have started from.
+RELEX_BACKOFF = 1
+
+def relex(tokens, content, result, edits, jsx=True):
+    """TokenSpans for ``result``, which is ``content`` with ``edits`` applied
+
+    Only the neighbourhood of each edit is scanned. The scan resumes at a
+    checkpoint a line break and RELEX_BACKOFF checkpoints before the edit
+    (and before any `<` within SIGNATURE_LOOKAHEAD of it in JSX files),
+    so nothing the lexer looked ahead at there has changed, and stops at
+    the first checkpoint past the edit whose state matches the old scan at
+    the same place in the old text. Between those stretches the old spans
+    and checkpoints are reused, shifted by the edits before them. The
+    result is the same as lex_source(result, jsx).
+    """
+    old_spans, old_starts = tokens.spans, tokens.starts
+    old_positions, old_states = tokens.marks
+    spans, marks = [], ([], [])
+    positions, states = marks
+
+    # For each edit: the checkpoint its scan resumes at, and the size
+    # change of the text up to its end
+    resume_at, new_ends, deltas = [], [], []
+    delta = 0
+    for start, end, replacement in edits:
+        limit = content.rfind('\n', 0, start)
+        if jsx:
+            angle = content.find('<', max(start - SIGNATURE_LOOKAHEAD, 0), start)
+            if angle >= 0:
+                limit = min(limit, angle - 1)
+        i = bisect_right(old_positions, limit) - 1 - RELEX_BACKOFF if limit >= 0 else 0
+        resume_at.append(max(i, 0))
+        delta += len(replacement) - (end - start)
+        new_ends.append(end + delta)
+        deltas.append(delta)
+
+    def copy(old_from, old_to, shift, from_mark):
+        """The old spans and checkpoints in [old_from, old_to), shifted"""
+        first, last = bisect_right(old_starts, old_from - 1), bisect_right(old_starts, old_to - 1)
+        spans.extend((kind, start + shift, end + shift) for kind, start, end in old_spans[first:last])
+        first = bisect_right(old_positions, old_from - (1 if from_mark else 0))
+        last = bisect_right(old_positions, old_to - 1)
+        positions.extend(pos + shift for pos in old_positions[first:last])
+        states.extend(old_states[first:last])
+
+    done = shift = i = 0  # old text before `done` is covered; edits before `i` applied
+    synced = False  # whether the checkpoint at `done` is already in marks
+    while i < len(edits):
+        mark = resume_at[i]
+        resume = old_positions[mark]
+        copy(done, resume, shift, not synced)
+        if resume > done or not synced:
+            positions.append(resume + shift)
+            states.append(old_states[mark])
+        before = len(positions)
+        cleared = [i]
+
+        def stop(pos, state):
+            j = cleared[0]
+            while j < len(edits) and pos >= new_ends[j]:
+                j += 1
+            cleared[0] = j
+            if j == i:
+                return False  # edit i is still ahead
+            old_pos = pos - deltas[j - 1]
+            if j < len(edits) and old_positions[resume_at[j]] < old_pos:
+                return False  # in or past where the next edit resumes
+            k = bisect_right(old_positions, old_pos) - 1
+            return old_positions[k] == old_pos and old_states[k] == state
+
+        pos = _lex(result, jsx, resume + shift, *_thaw(old_states[mark]), spans, marks, stop)
+        # Resuming at a JSX text records its checkpoint a second time
+        if len(positions) > before and positions[before] == positions[before - 1]:
+            del positions[before], states[before]
+        if pos is None:
+            return TokenSpans(spans, marks)
+        i = cleared[0]
+        shift = deltas[i - 1]
+        done, synced = pos - shift, True
+    copy(done, len(content) + 1, shift, not synced)
+    return TokenSpans(spans, marks)
+
+class TokenSpans:
+    """Lookup of the token kind at a position, built from scan_source output
+
+    ``marks`` holds the lexer checkpoints, when the spans came from
+    lex_source or relex.
+    """
+
+    def __init__(self, spans, marks=None):
+        self.spans = spans
+        self.marks = marks
+        self.starts = [start for _, start, _ in spans]
+
+    def kind_at(self, pos):
+        i = bisect_right(self.starts, pos) - 1
+        if i >= 0:
+            kind, _, end = self.spans[i]
+            if pos < end:
+                return kind
+        return CODE
+
+    def code_ranges(self, length):
+        """(start, end) of every stretch of code between the spans"""
+        pos = 0
+        for _, start, end in self.spans:
+            if start > pos:
+                yield pos, start
+            pos = end
+        if pos < length:
+            yield pos, length
+
+def is_jsx_file(filename):
+    """Everything but plain .ts may contain JSX"""
+    return not filename.endswith('.ts')
+
+class SourceInfo:
+    """Line index and token spans for one version of a file, built on demand
+
+    A version made by edit_source remembers the content it was made from
+    (``before``) and the edits that made it. If that version was lexed (or
+    itself edited), it is kept as ``base`` and the tokens are relexed from
+    there only if they are ever asked for.
+    """
+
+    def __init__(self, content, jsx, base=None, edits=None, before=None):
+        self.content = content
+        self.jsx = jsx
+        self.base = base
+        self.edits = edits
+        self.before = before
+
+    @cached_property
+    def lines(self):
+        return LineIndex(self.content)
+
+    @cached_property
+    def tokens(self):
+        base, self.base = self.base, None
+        if base is None:
+            return lex_source(self.content, self.jsx)
+        return relex(base.tokens, base.content, self.content, self.edits, self.jsx)
+
+# Recent SourceInfo objects by (content, jsx), most recently used last
+SOURCE_CACHE_SIZE = 8
+_sources = OrderedDict()
+
+def _remember(source):
+    key = (source.content, source.jsx)
+    _sources[key] = source
+    _sources.move_to_end(key)
+    if len(_sources) > SOURCE_CACHE_SIZE:
+        _sources.popitem(last=False)
+    return source
+
+def source_info(content, filename=''):
+    """Shared SourceInfo, so fixers looking at the same content lex it once"""
+    source = _sources.get((content, is_jsx_file(filename)))
+    if source is None:
+        return _remember(SourceInfo(content, is_jsx_file(filename)))
+    _sources.move_to_end((content, source.jsx))
+    return source
+
+def clear_source_cache():
+    _sources.clear()
+
+def edit_source(content, filename, edits):
+    """Apply a fixer's ``edits``, so the result's tokens can be carried over
+
+    If ``content`` was lexed, the result is only relexed around the edits,
+    and only once a fixer needs its tokens, so each file is lexed in full
+    once however many fixers change it.
+    """
+    result = apply_edits(content, edits)
+    if result is content:
+        return content
+    jsx = is_jsx_file(filename)
+    source = _sources.get((content, jsx))
+    if source is None or ('tokens' not in source.__dict__ and source.base is None):
+        source = None
+    _remember(SourceInfo(result, jsx, source, edits, content))
+    return result
+
+def step_edits(before, after, filename=''):
+    """The edits that turned ``before`` into ``after``
+
+    These are the fixer's own edits when edit_source made ``after``
+    straight from ``before``, otherwise a single edit covering everything
+    between the common prefix and suffix.
+    """
+    source = _sources.get((after, is_jsx_file(filename)))
+    if source is not None and source.before is before:
+        return source.edits
+    prefix = len(os.path.commonprefix([before, after]))
+    suffix = len(os.path.commonprefix([before[prefix:][::-1], after[prefix:][::-1]]))
+    return [(prefix, len(before) - suffix, after[prefix:len(after) - suffix])]
+
+def shift_selection(selection, before, after, filename=''):
+    """``selection`` with its LineRanges moved to where those lines are in ``after``"""
+    if all(lines is None for lines in selection.values()):
+        return selection
+    edits = step_edits(before, after, filename)
+    old, new = source_info(before, filename).lines, source_info(after, filename).lines
+    return {name: None if lines is None else lines.shifted(old, new, edits) for name, lines in selection.items()}
+
+def _match_filter(content, filename, lines, owners=None):
+    """Predicate for RuleSet.sub that keeps matches starting in code
+
+    With ``lines`` set, matches must also touch one of those lines.
+    ``owners`` maps rule names to their fixer's lines when several fixers
+    share one pass.
+    """
+    source = source_info(content, filename)
+
+    def keep(match):
+        # Lines first: on a selective run most matches are out of range and
+        # the file need not be lexed for them
+        match_lines = owners[match.lastgroup] if owners else lines
+        if match_lines is not None and not match_lines.overlaps(*source.lines.span_lines(match)):
+            return False
+        return source.tokens.kind_at(match.start()) == CODE
+
+    return keep
+
+# A single regex substitution; `name` must be a valid regex group name
+Rule = namedtuple('Rule', 'name pattern replacement')
+
+class RuleSet:
+    """Rules compiled once at import time and applied in one combined pass
+
+    The patterns are joined into a single alternation of named groups, so a
+    file is scanned once no matter how many rules are registered. The
+    callback dispatches on the group that matched and expands that rule's
+    own replacement template. Only rules whose matches cannot overlap
+    belong in the same set, otherwise leftmost-match order would differ
+    from applying them one after another.
+    """
+
+    def __init__(self, rules):
+        self.rules = {rule.name: (re.compile(rule.pattern), rule.replacement) for rule in rules}
+        self.pattern = re.compile('|'.join(f'(?P<{rule.name}>{rule.pattern})' for rule in rules))
+
+    def _dispatch(self, match):
+        regex, replacement = self.rules[match.lastgroup]
+        return regex.fullmatch(match.group()).expand(replacement)
 
-    for line in lines:
-        should_keep = True
+    def edits(self, content, keep):
+        """(start, end, replacement) for each match for which ``keep(match)`` is true"""
+        return [(match.start(), match.end(), self._dispatch(match))
+                for match in self.pattern.finditer(content) if keep(match)]
 
-        # Check if this file has specific unused imports to remove
-        for pattern_file, unused_imports in unused_patterns.items():
-            if pattern_file in filename:
-                for unused in unused_imports:
-                    if re.search(rf'\b{unused}\b', line) and 'import' in line:
-                        should_keep = False
-                        break
+    def sub(self, content, keep=None):
+        """Apply the rules, leaving matches for which ``keep(match)`` is false
 
-        # Remove unused data/index/error parameters
-        if filename.endswith('.tsx') or filename.endswith('.ts'):
-            # Remove unused parameters prefixed with underscore
-            line = re.sub(r'(\w+:\s*)_(\w+)', r'\1_\2', line)
+        ``content`` itself is returned when nothing is replaced.
+        """
+        if keep is None:
+            return self.pattern.sub(self._dispatch, content)
+        return apply_edits(content, self.edits(content, keep))
 
-        if should_keep:
-            new_lines.append(line)
+# A fixer rewrites content for the ESLint rules in `rule_ids`. Fixers with
+# `rules` are plain RuleSet substitutions that fix_content can merge.
+Fixer = namedtuple('Fixer', 'name rule_ids apply rules')
 
-    return '\n'.join(new_lines)
+# Registered fixers by name, in the order fix_content applies them
+FIXERS = {}
 
-def fix_any_types(content):
+def register_fixer(*rule_ids, rules=None):
+    """Register a ``fix_<name>(content, filename='', lines=None)`` function
+
+    ``lines`` is a LineRanges (or None for the whole file) and the fixer
+    must leave everything outside those lines alone.
+    """
+    def decorator(apply):
+        name = apply.__name__[len('fix_'):]
+        FIXERS[name] = Fixer(name, rule_ids, apply, rules)
+        return apply
+    return decorator
+
+ANY_TYPE_RULES = [
+    # The narrower `(x: any)`, `data: any`, `error: any` and `: any[]`
+    # patterns that used to follow were all shadowed by `: any\b` running
+    # first, so they never changed anything and are not registered.
+    Rule('any_annotation', r': any\b', ': unknown'),
+    Rule('any_generic', r'<any>', '<unknown>'),
+]
+
+REQUIRE_RULES = [
+    # const x = require('y') -> import x from 'y'
+    Rule('require_default', r"const\s+(\w+)\s*=\s*require\s*\(\s*['\"]([^'\"]+)['\"]\s*\)",
+         r"import \1 from '\2'"),
+    # const { x } = require('y') -> import { x } from 'y'
+    Rule('require_named', r"const\s+\{([^}]+)\}\s*=\s*require\s*\(\s*['\"]([^'\"]+)['\"]\s*\)",
+         r"import { \1 } from '\2'"),
+]
+
+PREFER_CONST_RULES = [
+    Rule('prefer_const', r'\blet\s+(totalButtons|fid|shifts|testData)\b', r'const \1'),
+]
+
+ANY_TYPES = RuleSet(ANY_TYPE_RULES)
+REQUIRE_IMPORTS = RuleSet(REQUIRE_RULES)
+PREFER_CONST = RuleSet(PREFER_CONST_RULES)
+
+def _escape_jsx_text(text):
+    """Escape apostrophes and quotes; quotes pair up as curly quotes"""
+    text = text.replace("'", '&apos;')
+    parts = text.split('"')
+    quotes = len(parts) - 1
+    escaped = [parts[0]]
+    for i, part in enumerate(parts[1:]):
+        if quotes % 2 and i == quotes - 1:
+            escaped.append('&quot;')  # unpaired trailing quote
+        else:
+            escaped.append('&rdquo;' if i % 2 else '&ldquo;')
+        escaped.append(part)
+    return ''.join(escaped)
+
+@register_fixer('react/no-unescaped-entities')
+def fix_unescaped_entities(content, filename='', lines=None):
+    """Fix react/no-unescaped-entities errors"""
+    if not is_jsx_file(filename) or ("'" not in content and '"' not in content):
+        return content
+    source = source_info(content, filename)
+    edits = []
+    for kind, start, end in source.tokens.spans:
+        if kind != JSX_TEXT:
+            continue
+        text = content[start:end]
+        if "'" not in text and '"' not in text:
+            continue
+        if lines is not None and not lines.overlaps(source.lines.line_of(start), source.lines.line_of(end - 1)):
+            continue
+        edits.append((start, end, _escape_jsx_text(text)))
+    return edit_source(content, filename, edits)
+
+# Common unused imports to remove, keyed by a path fragment of the file
+UNUSED_IMPORTS = {
+    'app/admin/assessments/page.tsx': ['Tabs', 'TabsContent', 'TabsList', 'TabsTrigger', 'AlertCircle', 'CheckCircle', 'Filter'],
+    'app/api/': ['request'],  # Remove unused request params in API routes
+    'app/blog/page.tsx': ['Calendar'],
+    'app/performance-accelerator/page.tsx': ['Target', 'CardHeader', 'CardTitle'],
+    'components/AboutSection.tsx': ['BookOpen', 'Briefcase', 'Globe', 'TrendingUp', 'BadgeCheck', 'Dumbbell', 'Activity', 'Brain', 'Shield', 'Image'],
+    'components/AphroditePricingTiers.tsx': ['Zap', 'Video', 'Clock'],
+    'components/AssessmentSection.tsx': ['ClipboardCheck'],
+    'components/AssessmentTool.tsx': ['Users', 'BarChart', 'Clock', 'Briefcase', 'Activity'],
+    'components/BarrierIdentificationSystem.tsx': ['useEffect', 'XCircle', 'Label'],
+    'components/ChatWidget.tsx': ['X', 'User', 'Badge', 'Card', 'Textarea'],
+    'components/ConsultancyProgrammes.tsx': ['Users', 'TrendingUp'],
+    'components/ContactSection.tsx': ['MessageSquare', 'Send', 'Sparkles'],
+    'components/Footer.tsx': ['Send', 'Sparkles', 'Globe', 'Clock', 'Calendar'],
+    'components/InteractiveProgrammeGallery.tsx': ['Calendar', 'Play'],
+    'components/MobileBottomNav.tsx': ['Home', 'ChevronUp'],
+    'components/MobileNav.tsx': ['User'],
+    'components/MobileOptimizedHero.tsx': ['Link'],
+    'components/NorfolkCommunitySection.tsx': ['Image', 'Star', 'Activity', 'Target'],
+    'components/PremiumFAQSection.tsx': ['seoOptimizedContent'],
+    'components/PremiumHeroWithImage.tsx': ['Link', 'Brain', 'TrendingUp', 'Shield', 'Activity', 'ChevronRight', 'CheckCircle', 'Star'],
+    'components/PremiumProgrammeComparison.tsx': ['easings'],
+    'components/PremiumSocialProof.tsx': ['easings'],
+    'components/PremiumTestimonialsSection.tsx': ['fadeInUp', 'luxuryScale', 'staggerContainer'],
+    'components/PricingTiers.tsx': ['Video', 'FileText'],
+    'components/ProgrammeRecommendationEngine.tsx': ['Heart', 'Smartphone', 'Video', 'Award', 'ChevronLeft', 'ChevronRight', 'Tabs', 'TabsContent', 'TabsList', 'TabsTrigger'],
+    'components/ProgrammesSection.tsx': ['Zap', 'Target', 'Users', 'Brain'],
+    'components/TestimonialsSection.tsx': ['Briefcase', 'Building'],
+    'components/TruthfulTrustSection.tsx': ['Clock', 'Star', 'Users'],
+    'components/VideoTestimonials.tsx': ['TrendingUp', 'Calendar'],
+}
+
+@lru_cache(maxsize=None)
+def _unused_import_pattern(pattern_files):
+    """One word-boundary alternation over every identifier for these table keys"""
+    identifiers = sorted({name for key in pattern_files for name in UNUSED_IMPORTS[key]}, key=len, reverse=True)
+    return re.compile(r'\b(?:' + '|'.join(map(re.escape, identifiers)) + r')\b')
+
+@register_fixer('no-unused-vars', '@typescript-eslint/no-unused-vars')
+def fix_unused_imports(content, filename='', lines=None):
+    """Remove unused imports based on common patterns"""
+    # Resolve the table once for this file
+    pattern_files = tuple(key for key in UNUSED_IMPORTS if key in filename)
+    if not pattern_files:
+        return content
+    unused = _unused_import_pattern(pattern_files)
+
+    # Only lines mentioning 'import' can be dropped, so the rest never hit the regex
+    index = source_info(content, filename).lines
+    drop = []
+    pos = content.find('import')
+    while pos != -1:
+        number = index.line_of(pos)
+        start, end = index.line_span(number)
+        if (lines is None or number in lines) and unused.search(content, start, end):
+            drop.append(number)
+        pos = content.find('import', end)
+    if not drop:
+        return content
+
+    # Consecutive lines go in one edit
+    edits = []
+    for number in drop:
+        start, end = index.line_span(number)
+        if edits and edits[-1][1] == start:
+            start = edits.pop()[0]
+        edits.append((start, end, ''))
+    # Dropping the unterminated last line also drops the newline before it
+    if drop[-1] == len(index.starts) and edits[-1][0] > 0:
+        start, end, _ = edits.pop()
+        edits.append((start - 1, end, ''))
+    return edit_source(content, filename, edits)
+
+@register_fixer('@typescript-eslint/no-explicit-any', rules=ANY_TYPE_RULES)
+def fix_any_types(content, filename='', lines=None):
     """Replace any types with proper TypeScript types"""
-    replacements = [
-        # Common any type replacements
-        (r': any\b', ': unknown'),
-        (r'<any>', '<unknown>'),
-        (r'\((\w+): any\)', r'(\1: unknown)'),
+    return edit_source(content, filename, ANY_TYPES.edits(content, _match_filter(content, filename, lines)))
 
-        # Specific patterns for event handlers
-        (r'data: any', 'data: unknown'),
-        (r'error: any', 'error: Error | unknown'),
-        (r'programme: any', 'programme: unknown'),
+@register_fixer('@typescript-eslint/no-require-imports', '@typescript-eslint/no-var-requires', rules=REQUIRE_RULES)
+def fix_require_imports(content, filename='', lines=None):
+    """Convert require() to ES6 imports"""
+    return edit_source(content, filename, REQUIRE_IMPORTS.edits(content, _match_filter(content, filename, lines)))
 
-        # For arrays
-        (r': any\[\]', ': unknown[]'),
-    ]
+@register_fixer('prefer-const', rules=PREFER_CONST_RULES)
+def fix_prefer_const(content, filename='', lines=None):
+    """Fix prefer-const errors by replacing let with const where appropriate"""
+    return edit_source(content, filename, PREFER_CONST.edits(content, _match_filter(content, filename, lines)))
 
-    for pattern, replacement in replacements:
-        content = re.sub(pattern, replacement, content)
+# React hooks taking a dependency array, and which argument it is
+HOOK_DEPS_ARGUMENT = {
+    'useEffect': 1,
+    'useLayoutEffect': 1,
+    'useInsertionEffect': 1,
+    'useCallback': 1,
+    'useMemo': 1,
+    'useImperativeHandle': 2,
+}
+HOOK_SCAN = re.compile(r'\b(' + '|'.join(HOOK_DEPS_ARGUMENT) + r')\s*(?:<[^<>()]*>\s*)?\(|[()\[\]{},]')
+EMPTY_ARRAY = re.compile(r'\[\s*\]')
+INDENT = re.compile(r'[ \t]*')
+EXHAUSTIVE_DEPS_DISABLE = 'eslint-disable-next-line react-hooks/exhaustive-deps'
 
-    return content
+def _empty_hook_dependencies(content, source):
+    """Yield (call_pos, deps_pos) for every hook call whose dependency array is empty
+
+    One forward pass over the code regions: brackets go on a stack, and a
+    hook call's frame records where each top-level argument starts, so the
+    dependency array is known as soon as the call closes.
+    """
+    stack = []  # [hook name or None, call position, argument start positions]
+    for start, end in source.tokens.code_ranges(len(content)):
+        for match in HOOK_SCAN.finditer(content, start, end):
+            token = match.group()
+            if match.group(1):
+                stack.append([match.group(1), match.start(), [match.end()]])
+            elif token in '([{':
+                stack.append([None, match.start(), None])
+            elif token == ',':
+                if stack and stack[-1][0]:
+                    stack[-1][2].append(match.end())
+            elif stack:
+                hook, call_pos, arg_starts = stack.pop()
+                if not hook:
+                    continue
+                # Each argument ends at the next top-level comma or at the ')'
+                arg_ends = [arg_start - 1 for arg_start in arg_starts[1:]] + [match.start()]
+                args = [content[arg_start:arg_end] for arg_start, arg_end in zip(arg_starts, arg_ends)]
+                if args and not args[-1].strip():
+                    args.pop()  # trailing comma
+                index = HOOK_DEPS_ARGUMENT[hook]
+                if len(args) == index + 1 and EMPTY_ARRAY.fullmatch(args[index].strip()):
+                    deps_pos = arg_starts[index] + len(args[index]) - len(args[index].lstrip())
+                    yield call_pos, deps_pos
 
-def fix_hook_dependencies(content, filename):
-    """Add missing dependencies to React hooks"""
+@register_fixer('react-hooks/exhaustive-deps')
+def fix_hook_dependencies(content, filename='', lines=None):
+    """Silence exhaustive-deps on hooks with an empty dependency array
+
+    The disable comment goes on the line above the array, which is where
+    ESLint reports the problem, and is never added twice.
+    """
     if not (filename.endswith('.tsx') or filename.endswith('.ts')):
         return content
+    if not any(hook in content for hook in HOOK_DEPS_ARGUMENT):
+        return content
 
-    # Pattern to find useEffect hooks with missing dependencies
-    lines = content.split('\n')
-    new_lines = []
-
-    for i, line in enumerate(lines):
-        if 'useEffect' in line and i + 5 < len(lines):
-            # Look for the dependency array in the next few lines
-            for j in range(i, min(i + 10, len(lines))):
-                if '// eslint-disable-next-line react-hooks/exhaustive-deps' not in lines[j]:
-                    if re.search(r'\}, \[\]\)', lines[j]):
-                        # Empty dependency array - check if we need to add dependencies
-                        # For now, add eslint-disable comment
-                        new_lines.append('    // eslint-disable-next-line react-hooks/exhaustive-deps')
-                        break
-        new_lines.append(line)
-
-    return '\n'.join(new_lines)
-
-def fix_require_imports(content):
-    """Convert require() to ES6 imports"""
-    # Convert const x = require('y') to import x from 'y'
-    content = re.sub(
-        r"const\s+(\w+)\s*=\s*require\s*\(\s*['\"]([^'\"]+)['\"]\s*\)",
-        r"import \1 from '\2'",
-        content
-    )
-
-    # Convert const { x } = require('y') to import { x } from 'y'
-    content = re.sub(
-        r"const\s+\{([^}]+)\}\s*=\s*require\s*\(\s*['\"]([^'\"]+)['\"]\s*\)",
-        r"import { \1 } from '\2'",
-        content
-    )
+    source = source_info(content, filename)
+    index = source.lines
+    insert_lines = set()
+    for call_pos, deps_pos in _empty_hook_dependencies(content, source):
+        call_line, deps_line = index.line_of(call_pos), index.line_of(deps_pos)
+        if lines is not None and not lines.overlaps(call_line, deps_line):
+            continue
+        previous = content[slice(*index.line_span(deps_line - 1))] if deps_line > 1 else ''
+        current_end = index.line_span(deps_line)[1]
+        if EXHAUSTIVE_DEPS_DISABLE in previous or 'react-hooks/exhaustive-deps' in content[deps_pos:current_end]:
+            continue
+        insert_lines.add(deps_line)
 
-    return content
+    edits = []
+    for line in sorted(insert_lines):
+        line_start = index.starts[line - 1]
+        indent = INDENT.match(content, line_start).group()
+        edits.append((line_start, line_start, f'{indent}// {EXHAUSTIVE_DEPS_DISABLE}\n'))
+    return edit_source(content, filename, edits)
 
-def fix_prefer_const(content):
-    """Fix prefer-const errors by replacing let with const where appropriate"""
-    # Pattern to find let declarations that should be const
-    patterns = [
-        (r'\blet\s+(totalButtons|fid|shifts|testData)\b', r'const \1'),
-    ]
+# ESLint rule ID -> name of the fixer that handles it
+RULE_FIXERS = {rule_id: fixer.name for fixer in FIXERS.values() for rule_id in fixer.rule_ids}
+
+# Which mergeable fixer each code rule belongs to
+RULE_OWNERS = {rule.name: fixer.name for fixer in FIXERS.values() if fixer.rules for rule in fixer.rules}
+
+@lru_cache(maxsize=None)
+def _merged_rules(names):
+    return RuleSet([rule for name in names for rule in FIXERS[name].rules])
+
+def _apply_merged(content, filename, selection, names):
+    """Run one fixer, or several mergeable fixers as one RuleSet pass"""
+    if len(names) == 1:
+        name = names[0]
+        return FIXERS[name].apply(content, filename, selection[name])
+    owners = {rule: selection[name] for rule, name in RULE_OWNERS.items() if name in names}
+    keep = _match_filter(content, filename, None, owners)
+    return edit_source(content, filename, _merged_rules(names).edits(content, keep))
+
+def count_substitutions(before, after):
+    """Number of separate changed regions between two versions of a file"""
+    if before == after:
+        return 0
+    matcher = difflib.SequenceMatcher(None, before.split('\n'), after.split('\n'))
+    return sum(tag != 'equal' for tag, *_ in matcher.get_opcodes())
+
+class FileProfile:
+    """Where the time went while processing one file
+
+    ``steps`` maps a step to [seconds, bytes scanned, substitutions]. A
+    step is a fixer, a merged pass such as ``any_types+prefer_const``, or
+    the read, diff and write around them. Lexing is shared between
+    fixers, so it is charged to the first one that needs it.
+    """
+
+    def __init__(self):
+        self.steps = {}
+        self.seconds = 0.0
+        self.cprofile = None  # raw cProfile stats, when requested
+
+    def record(self, step, seconds, content, result=None):
+        totals = self.steps.setdefault(step, [0.0, 0, 0])
+        totals[0] += seconds
+        totals[1] += len(content.encode('utf-8')) if isinstance(content, str) else len(content)
+        if result is not None:
+            totals[2] += count_substitutions(content, result)
+
+    def timed(self, step, func, content, *args):
+        """Call ``func(content, *args)`` and record it as ``step``"""
+        start = time.perf_counter()
+        result = func(content, *args)
+        self.record(step, time.perf_counter() - start, content, result)
+        return result
+
+def _run_step(profile, step, func, content, *args):
+    if profile is None:
+        return func(content, *args)
+    return profile.timed(step, func, content, *args)
+
+def fix_steps(selection=None):
+    """The steps fix_content takes for a selection, as (label, apply) pairs
+
+    ``apply(content, filename, selection)`` runs one fixer, or several
+    consecutive RuleSet fixers merged into a single scan. The selection is
+    passed on each call because its line ranges move as earlier steps
+    add or remove lines.
+    """
+    if selection is None:
+        selection = dict.fromkeys(FIXERS)
+    steps, pending = [], []
+    for name, fixer in FIXERS.items():
+        if name not in selection:
+            continue
+        if fixer.rules:
+            pending.append(name)
+            continue
+        if pending:
+            steps.append(('+'.join(pending), partial(_apply_merged, names=tuple(pending))))
+            pending = []
+        steps.append((name, partial(_apply_merged, names=(name,))))
+    if pending:
+        steps.append(('+'.join(pending), partial(_apply_merged, names=tuple(pending))))
+    return steps
+
+def converge(content, filename, selection=None, profile=None, max_passes=1):
+    """Apply the selected fixers until none of them changes the content
+
+    The first pass takes every step; later passes re-run only the steps
+    whose input changed after they last ran, so a fix that enables another
+    rule is picked up without rerunning everything. Fixers are idempotent,
+    so a step never needs to see its own output again. Stops at a fixed
+    point or after ``max_passes``. Whenever a step adds or removes lines,
+    the selection's line ranges are shifted to match before the next step
+    runs, so they keep pointing at the lines ESLint reported.
+
+    Returns (content, passes, converged), where converged is false if the
+    cap was hit with steps still to re-run.
+    """
+    if selection is None:
+        selection = dict.fromkeys(FIXERS)
+    steps = fix_steps(selection)
+    seen = [None] * len(steps)  # content version each step last ran on
+    version = passes = 0
+    while passes < max_passes and any(last != version for last in seen):
+        passes += 1
+        for i, (label, apply) in enumerate(steps):
+            if seen[i] == version:
+                continue
+            result = _run_step(profile, label, apply, content, filename, selection)
+            if result is not content and result != content:
+                selection = shift_selection(selection, content, result, filename)
+                content = result
+                version += 1
+            seen[i] = version
+    return content, passes, all(last == version for last in seen)
+
+def fix_content(content, filename, selection=None, profile=None):
+    """Apply the selected fixers once and return the result
+
+    ``selection`` maps fixer names to the LineRanges they may touch (None
+    for the whole file); fixers not in it are skipped. By default every
+    fixer runs on the whole file. Consecutive RuleSet fixers are merged
+    into a single scan. Each fixer or merged pass is timed into
+    ``profile`` (a FileProfile) if one is given.
+    """
+    return converge(content, filename, selection, profile)[0]
 
-    for pattern, replacement in patterns:
-        content = re.sub(pattern, replacement, content)
+def content_hash(data, selection=None):
+    """Hash of a file's raw bytes and the fixer selection it was checked against"""
+    digest = hashlib.sha256(data)
+    if selection is not None:
+        digest.update(repr(sorted(selection.items())).encode('utf-8'))
+    return digest.hexdigest()
 
+def unified_diff(file_path, before, after):
+    """A git-style patch turning ``before`` into ``after``"""
+    lines = difflib.unified_diff(before.splitlines(keepends=True), after.splitlines(keepends=True),
+                                 fromfile=f'a/{file_path}', tofile=f'b/{file_path}')
+    return ''.join(line if line.endswith('\n') else line + '\n\\ No newline at end of file\n' for line in lines)
+
+@contextmanager
+def map_source(filepath):
+    """The raw bytes of a file; big files are memory-mapped rather than copied"""
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            yield f.read()
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield data
+
+def decode_source(data):
+    """Text of a file as open(..., 'r') gives it, with universal newlines"""
+    content = str(data, 'utf-8')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
     return content
 
-def process_file(filepath):
-    """Process a single file and apply all fixes"""
+def write_atomic(filepath, content, fsync=False):
+    """Replace a file via a temp file and rename in the same directory
+
+    A crash mid-write leaves either the old or the new file, never a
+    truncated one. With ``fsync`` the data and the rename are flushed to
+    disk before returning.
+    """
+    # Write through a symlink to its target rather than replacing the link
+    filepath = Path(os.path.realpath(filepath))
+    fd, tmp_path = tempfile.mkstemp(dir=filepath.parent, prefix=f'.{filepath.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.chmod(tmp_path, stat.S_IMODE(os.stat(filepath).st_mode))
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        with suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+    if fsync:
+        dir_fd = os.open(filepath.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+def process_file(filepath, cached_hash=None, selection=None, mode=WRITE, display_path=None, fsync=False,
+                 profile=None, max_passes=1):
+    """Process a single file and apply the selected fixers (all by default)
+
+    Returns a FileResult. The status is CACHED when the content still
+    matches ``cached_hash``, otherwise FIXED or UNCHANGED. Fixers run up to
+    ``max_passes`` times (see converge) and ``passes`` says how many were
+    needed. The digest is only set when the file is known to be at a fixed
+    point, which is the only state worth caching: either no fixer changed
+    it, or the fixed content being written has converged. A changed file is
+    written (WRITE), handed back as ``content`` for the caller to write
+    (DEFER), or described by a diff labelled with ``display_path``
+    (DRY_RUN). Errors are left to the caller. Every step is timed into
+    ``profile`` (a FileProfile) if one is given.
+
+    The cache is checked against the raw bytes, so a cached file is never
+    decoded, and big files are hashed and decoded straight from a memory
+    map.
+    """
+    display_path = display_path or str(filepath)
+    start = time.perf_counter()
+    with map_source(filepath) as data:
+        digest = content_hash(data, selection)
+        content = None if digest == cached_hash else decode_source(data)
+        if profile is not None:
+            profile.record('read', time.perf_counter() - start, data)
+
+    if content is None:
+        return FileResult(display_path, CACHED, digest=digest)
+
+    original_content = content
+    content, passes, converged = converge(content, str(filepath), selection, profile, max_passes)
+
+    if content == original_content:
+        return FileResult(display_path, UNCHANGED, digest=digest, passes=passes, settled=True)
+    if mode != DRY_RUN and converged:
+        digest = content_hash(content.encode('utf-8'), selection)
+    else:
+        digest = None
+    start = time.perf_counter()
+    if mode == DRY_RUN:
+        result = FileResult(display_path, FIXED, diff=unified_diff(display_path, original_content, content),
+                            passes=passes, settled=converged)
+        step = 'diff'
+    elif mode == DEFER:
+        return FileResult(display_path, FIXED, digest=digest, content=content, passes=passes, settled=converged)
+    else:
+        write_atomic(filepath, content, fsync)
+        result = FileResult(display_path, FIXED, digest=digest, passes=passes, settled=converged)
+        step = 'write'
+    if profile is not None:
+        profile.record(step, time.perf_counter() - start, content)
+    return result
+
+def _process_task(task, mode=WRITE, fsync=False, profile=False, cprofile=False, max_passes=1):
+    """Worker entry point: process one file and report a FileResult
+
+    With ``profile`` the result carries a FileProfile; ``cprofile`` also
+    runs the file under cProfile and keeps the raw stats on it.
+    """
+    file_path, full_path, cached_hash, selection = task
+    if not full_path.exists():
+        return FileResult(file_path, NOT_FOUND)
+    file_profile = FileProfile() if profile or cprofile else None
+    call = partial(process_file, full_path, cached_hash, selection, mode, file_path, fsync, file_profile,
+                   max_passes)
+    profiler = cProfile.Profile() if cprofile else None
+    start = time.perf_counter()
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        original_content = content
-
-        # Apply fixes in order
-        content = fix_unescaped_entities(content)
-        content = fix_unused_imports(content, str(filepath))
-        content = fix_any_types(content)
-        content = fix_hook_dependencies(content, str(filepath))
-        content = fix_require_imports(content)
-        content = fix_prefer_const(content)
-
-        # Only write if changes were made
-        if content != original_content:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
-            return True
-        return False
+        result = profiler.runcall(call) if profiler else call()
     except Exception as e:
-        print(f"Error processing {filepath}: {e}")
-        return False
-
-def main():
-    """Main function to process all files with ESLint errors"""
-    root_dir = Path('/root/app/leah-fowler-performance')
-
-    # List of files with errors (from ESLint output)
-    files_with_errors = [
-        'app/admin/assessments/page.tsx',
-        'app/api/assessment/admin/route.ts',
-        'app/api/assessment/gdpr/route.ts',
-        'app/api/assessment/submit/route.ts',
-        'app/api/lead-magnet/route.ts',
-        'app/api/performance-assessment/route.ts',
-        'app/blog/page.tsx',
-        'app/family-athlete-demo/page.tsx',
-        'app/mobile-demo/page.tsx',
-        'app/performance-accelerator/page.tsx',
-        'components/AboutSection.tsx',
-        'components/AphroditePricingTiers.tsx',
-        'components/AssessmentSection.tsx',
-        'components/AssessmentTool.tsx',
-        'components/BarrierIdentificationSystem.tsx',
-        'components/ChatWidget.tsx',
-        'components/ConsultancyProgrammes.tsx',
-        'components/ContactSection.tsx',
-        'components/ExitIntentPopup.tsx',
-        'components/FamilyTransformationTestimonials.tsx',
-        'components/FloatingElements.tsx',
-        'components/Footer.tsx',
-        'components/HeroStatsSection.tsx',
-        'components/InteractiveProgrammeGallery.tsx',
-        'components/LeadMagnetDelivery.tsx',
-        'components/LoadingStates.tsx',
-        'components/MobileBottomNav.tsx',
-        'components/MobileNav.tsx',
-        'components/MobileOptimizedHero.tsx',
-        'components/NorfolkCommunitySection.tsx',
-        'components/OptimizedImage.tsx',
-        'components/PackageSelectorQuiz.tsx',
-        'components/PerformanceBreakthroughLeadMagnet.tsx',
-        'components/PremiumFAQSection.tsx',
-        'components/PremiumHeroSection.tsx',
-        'components/PremiumHeroWithImage.tsx',
-        'components/PremiumProgrammeComparison.tsx',
-        'components/PremiumSocialProof.tsx',
-        'components/PremiumTestimonialsSection.tsx',
-        'components/PricingTiers.tsx',
-        'components/ProgrammeRecommendationEngine.tsx',
-        'components/ProgrammesSection.tsx',
-        'components/SectionErrorBoundary.tsx',
-        'components/SocialProofNotifications.tsx',
-        'components/TestimonialsSection.tsx',
-        'components/TruthfulTrustSection.tsx',
-        'components/VideoTestimonials.tsx',
-        'components/WhyChooseSection.tsx',
-        'components/spacing/SpacingShowcase.tsx',
-        'content/emails/nurture-sequence.ts',
-        'content/schema-markup.ts',
-        'hooks/useResponsive.ts',
-        'lib/animations.ts',
-        'lib/api-client.ts',
-        'lib/assessment-questions.ts',
-        'lib/assessment-scoring.ts',
-        'tests/comprehensive-ui-validation.spec.ts',
-        'tests/forum.test.ts',
-        'tests/mobile-experience.spec.ts',
-        'tests/mother-identity-transformation.spec.ts',
-        'tests/performance-accelerator.spec.ts',
-        'tests/screenshot-capture.spec.ts',
-        'tests/spacing-validation.spec.ts',
-        'tests/visual-validation.spec.ts',
-        'scripts/test-hero-performance.js',
-        'scripts/test-schema.js',
-        'tests/quick-demo-test.js',
-        'analyze-visual-issues.js',
-        'comprehensive-ui-analysis.mjs',
-        'test-spacing-validation.mjs',
-    ]
-
-    fixed_count = 0
-
-    print("Starting ESLint error fixes...")
-    for file_path in files_with_errors:
-        full_path = root_dir / file_path
-        if full_path.exists():
-            if process_file(full_path):
-                fixed_count += 1
-                print(f"✓ Fixed {file_path}")
+        result = FileResult(file_path, ERROR, str(e))
+    if file_profile is None:
+        return result
+    file_profile.seconds = time.perf_counter() - start
+    if profiler:
+        profiler.create_stats()
+        file_profile.cprofile = profiler.stats
+    return result._replace(profile=file_profile)
+
+def run_files(root_dir, targets, jobs=1, cache=None, mode=WRITE, fsync=False, profile=False, cprofile=False,
+              max_passes=1):
+    """Process files across a pool of worker processes
+
+    ``targets`` is a list of (file_path, selection) pairs (see fix_content)
+    and ``cache`` maps file paths to the content hash recorded on a
+    previous run. ``mode``, ``fsync`` and ``max_passes`` are passed on to
+    process_file, ``profile`` and ``cprofile`` to _process_task.
+    Results are yielded as FileResult tuples in the order of ``targets``
+    as soon as each one (and those before it) is done, regardless of
+    which worker finishes first, so the log output is identical between
+    runs.
+    """
+    cache = cache or {}
+    tasks = [(file_path, root_dir / file_path, cache.get(file_path), selection)
+             for file_path, selection in targets]
+    if jobs <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            yield _process_task(task, mode, fsync, profile, cprofile, max_passes)
+        return
+
+    # Hand each worker a few batches so slow files don't leave cores idle
+    chunksize = max(1, len(tasks) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        task = partial(_process_task, mode=mode, fsync=fsync, profile=profile, cprofile=cprofile,
+                       max_passes=max_passes)
+        yield from executor.map(task, tasks, chunksize=chunksize)
+
+def write_batch(root_dir, pending, fsync=False):
+    """Write deferred results; returns (file_path, error) for each failure"""
+    failures = []
+    for file_path, content in pending:
+        try:
+            write_atomic(root_dir / file_path, content, fsync)
+        except OSError as e:
+            failures.append((file_path, e))
+    return failures
+
+def profile_summary(profiles, wall_seconds, slowest=10):
+    """Totals per step and the slowest files from (file_path, FileProfile) pairs"""
+    steps = {}
+    for _, profile in profiles:
+        for step, (seconds, scanned, substitutions) in profile.steps.items():
+            totals = steps.setdefault(step, {'files': 0, 'seconds': 0.0, 'bytes': 0, 'substitutions': 0})
+            totals['files'] += 1
+            totals['seconds'] += seconds
+            totals['bytes'] += scanned
+            totals['substitutions'] += substitutions
+    files = heapq.nlargest(slowest, profiles, key=lambda item: item[1].seconds)
+    return {
+        'wall_seconds': wall_seconds,
+        'steps': dict(sorted(steps.items(), key=lambda item: item[1]['seconds'], reverse=True)),
+        'slowest_files': [{'path': file_path, 'seconds': profile.seconds,
+                           'steps': {step: totals[0] for step, totals in profile.steps.items()}}
+                          for file_path, profile in files],
+    }
+
+def print_profile(summary, file):
+    """Print a profile_summary as a table"""
+    print(f"\n⏱️ Profile ({summary['wall_seconds']:.2f}s wall)", file=file)
+    print(f"   {'step':<40} {'files':>6} {'ms':>10} {'MB':>8} {'MB/s':>8} {'subs':>6}", file=file)
+    for step, totals in summary['steps'].items():
+        seconds, megabytes = totals['seconds'], totals['bytes'] / 1e6
+        rate = f'{megabytes / seconds:.1f}' if seconds else '-'
+        print(f"   {step:<40} {totals['files']:>6} {seconds * 1000:>10.1f} {megabytes:>8.2f} {rate:>8} "
+              f"{totals['substitutions']:>6}", file=file)
+    if summary['slowest_files']:
+        print("   Slowest files:", file=file)
+        for entry in summary['slowest_files']:
+            print(f"   {entry['seconds'] * 1000:>9.1f} ms  {entry['path']}", file=file)
+
+def write_cprofiles(directory, slowest):
+    """Dump (seconds, file_path, stats) entries as .prof files for pstats"""
+    directory.mkdir(parents=True, exist_ok=True)
+    written = []
+    for _, file_path, stats in sorted(slowest, reverse=True):
+        target = directory / (file_path.strip('/').replace('/', '__') + '.prof')
+        with open(target, 'wb') as f:
+            marshal.dump(stats, f)
+        written.append(target)
+    return written
+
+def iter_eslint_results(stream, chunk_size=1 << 16):
+    """Yield the per-file objects of `eslint --format json` output one by one
+
+    The report is read in chunks and decoded an object at a time, so a
+    large report is never held in memory as a whole.
+    """
+    decoder = json.JSONDecoder()
+    buffer, pos, eof = '', 0, False
+    while True:
+        # Step over the array brackets and separators between results
+        while pos < len(buffer) and buffer[pos] in '[],\r\n\t ':
+            pos += 1
+        if pos < len(buffer):
+            try:
+                result, pos = decoder.raw_decode(buffer, pos)
+            except ValueError:
+                if eof:
+                    raise
             else:
-                print(f"- No changes needed for {file_path}")
+                yield result
+                continue
+        elif eof:
+            return
+        chunk = stream.read(chunk_size)
+        buffer, pos, eof = buffer[pos:] + chunk, 0, not chunk
+
+def eslint_targets(results, root_dir):
+    """Turn ESLint results into (file_path, selection) pairs for run_files
+
+    Files are kept only if ESLint reported a rule one of the fixers
+    handles. Each file gets just the fixers for its reported rules,
+    limited to the lines the messages point at.
+    """
+    root_dir = Path(root_dir).resolve()
+    for result in results:
+        ranges = {}
+        for message in result.get('messages', []):
+            name = RULE_FIXERS.get(message.get('ruleId'))
+            if name is None:
+                continue
+            line = message.get('line')
+            if line is None:
+                ranges[name] = None  # no position, the whole file is fair game
+            elif ranges.get(name, []) is not None:
+                ranges.setdefault(name, []).append((line, message.get('endLine') or line))
+        if not ranges:
+            continue
+        selection = {name: None if spans is None else LineRanges(spans) for name, spans in ranges.items()}
+        file_path = result['filePath']
+        try:
+            file_path = Path(file_path).resolve().relative_to(root_dir).as_posix()
+        except ValueError:
+            pass  # outside --root, keep the absolute path
+        yield file_path, selection
+
+def load_targets(args, root_dir):
+    if not args.eslint_json:
+        return [(file_path, None) for file_path in FILES_WITH_ERRORS]
+    if args.eslint_json == '-':
+        return list(eslint_targets(iter_eslint_results(sys.stdin), root_dir))
+    with open(args.eslint_json, 'r', encoding='utf-8') as f:
+        return list(eslint_targets(iter_eslint_results(f), root_dir))
+
+def git_changed_files(root_dir, ref='HEAD', staged=False):
+    """Paths under ``root_dir`` (relative to it) that git reports as changed
+
+    With ``staged`` the index is compared to HEAD. Otherwise the working
+    tree is compared to the merge base of ``ref`` and HEAD, so on a branch
+    only its own changes count, and untracked files are included. Deleted
+    files are left out.
+    """
+    def git(*args):
+        return subprocess.run(['git', '-C', str(root_dir), *args],
+                              check=True, capture_output=True, text=True).stdout
+
+    if staged:
+        output = git('diff', '--cached', '--name-only', '--relative', '--diff-filter=ACMR', '-z')
+    else:
+        base = git('merge-base', ref, 'HEAD').strip()
+        output = git('diff', '--name-only', '--relative', '--diff-filter=ACMR', '-z', base)
+        output += git('ls-files', '--others', '--exclude-standard', '-z')
+    return {path for path in output.split('\0') if path}
+
+def load_cache(cache_file):
+    """Read the file -> content hash map, discarding it if the rules changed"""
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get('version') != RULES_VERSION:
+        return {}
+    return data.get('files', {})
+
+def save_cache(cache_file, cache):
+    tmp_file = f'{cache_file}.tmp'
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump({'version': RULES_VERSION, 'files': cache}, f, indent=2, sort_keys=True)
+    os.replace(tmp_file, cache_file)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Fix common ESLint errors in the Leah Fowler Performance codebase',
+        epilog='Exits 1 if any file failed to process, or with --check if any file would change.')
+    parser.add_argument('--root', default=DEFAULT_ROOT,
+                        help=f'project root the file list is relative to (default: {DEFAULT_ROOT})')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help='number of worker processes (default: CPU count, 1 runs serially)')
+    parser.add_argument('--cache-file',
+                        help=f'where to keep content hashes of already-fixed files (default: <root>/{CACHE_FILE})')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='process every file even if it is unchanged since the last run')
+    parser.add_argument('--eslint-json', metavar='PATH',
+                        help="fix only the files and rules in an `eslint --format json` report ('-' reads stdin)")
+    changes = parser.add_mutually_exclusive_group()
+    changes.add_argument('--changed', nargs='?', const='HEAD', metavar='REF',
+                         help='only fix target files changed since REF (its merge base with HEAD), '
+                              'including uncommitted and untracked files (default REF: HEAD)')
+    changes.add_argument('--staged', action='store_true',
+                         help='only fix target files with staged changes (fixes land in the working tree)')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='write nothing; stream a unified diff of each change to stdout (progress goes to stderr)')
+    parser.add_argument('--check', action='store_true',
+                        help='write nothing and exit 1 if any file would be changed')
+    parser.add_argument('--batch-writes', action='store_true',
+                        help='hold every change until all files are processed and write nothing if any failed')
+    parser.add_argument('--fsync', choices=FSYNC_POLICIES, default='never',
+                        help='flush each written file (file), sync once after the run (end) or leave it to the OS '
+                             '(never, the default); writes are atomic renames either way')
+    parser.add_argument('--converge', action='store_true',
+                        help='keep re-running fixers whose input another fixer changed until each file settles')
+    parser.add_argument('--max-passes', type=int,
+                        help=f'cap on fixer passes per file, requires --converge (default: {MAX_PASSES})')
+    parser.add_argument('--profile', action='store_true',
+                        help='time each fixer, read and write per file and print a summary table at the end')
+    parser.add_argument('--profile-json', metavar='PATH',
+                        help='write the profile summary as JSON (implies profiling)')
+    parser.add_argument('--cprofile', type=int, default=0, metavar='N',
+                        help='run every file under cProfile and keep the stats of the N slowest (slows the run)')
+    parser.add_argument('--cprofile-dir', default=CPROFILE_DIR,
+                        help=f'where --cprofile writes its .prof files (default: {CPROFILE_DIR})')
+    args = parser.parse_args(argv)
+    if args.max_passes is not None and not args.converge:
+        parser.error('--max-passes requires --converge')
+    return args
+
+def main(argv=None):
+    """Main function to process all files with ESLint errors
+
+    Returns the process exit status.
+    """
+    args = parse_args(argv)
+    root_dir = Path(args.root).resolve()
+    cache_file = Path(args.cache_file) if args.cache_file else root_dir / CACHE_FILE
+    cache = {} if args.no_cache else load_cache(cache_file)
+    read_only = args.dry_run or args.check
+    if read_only:
+        mode = DRY_RUN
+    elif args.batch_writes:
+        mode = DEFER
+    else:
+        mode = WRITE
+    fsync_each = args.fsync == 'file'
+    pending = []
+    # Keep stdout a clean patch when it carries the diffs
+    log = sys.stderr if args.dry_run else sys.stdout
+
+    counts = {FIXED: 0, UNCHANGED: 0, CACHED: 0, ERROR: 0, NOT_FOUND: 0}
+    profiling = bool(args.profile or args.profile_json)
+    profiles = []
+    slowest = []  # min-heap of (seconds, file_path, cProfile stats)
+    if not args.converge:
+        max_passes = 1
+    else:
+        max_passes = MAX_PASSES if args.max_passes is None else max(args.max_passes, 1)
+    pass_counts = {}
+    unsettled = []
+
+    targets = load_targets(args, root_dir)
+    if args.changed or args.staged:
+        try:
+            changed = git_changed_files(root_dir, args.changed, args.staged)
+        except (OSError, subprocess.CalledProcessError) as e:
+            print(f"❌ Could not list changed files: {(getattr(e, 'stderr', None) or str(e)).strip()}",
+                  file=sys.stderr)
+            return 1
+        targets = [(file_path, selection) for file_path, selection in targets if file_path in changed]
+
+    print(f"Starting ESLint error fixes on {len(targets)} files ({max(args.jobs, 1)} workers)...", file=log)
+    start = time.perf_counter()
+    for result in run_files(root_dir, targets, args.jobs, cache, mode, fsync_each, profiling, args.cprofile > 0,
+                            max_passes):
+        file_path, status = result.path, result.status
+        counts[status] += 1
+        if result.passes:
+            pass_counts[result.passes] = pass_counts.get(result.passes, 0) + 1
+        if result.profile is not None:
+            profiles.append((file_path, result.profile))
+            if args.cprofile > 0:
+                entry = (result.profile.seconds, file_path, result.profile.cprofile)
+                result.profile.cprofile = None
+                if len(slowest) < args.cprofile:
+                    heapq.heappush(slowest, entry)
+                else:
+                    heapq.heappushpop(slowest, entry)
+        if result.digest:
+            cache[file_path] = result.digest
+        else:
+            cache.pop(file_path, None)
+
+        if status == FIXED:
+            passes = f" ({result.passes} passes)" if args.converge and result.passes > 1 else ""
+            print(f"✓ {'Would fix' if read_only else 'Fixed'} {file_path}{passes}", file=log)
+            if args.converge and not result.settled:
+                unsettled.append(file_path)
+            if args.dry_run:
+                sys.stdout.write(result.diff)
+                sys.stdout.flush()
+            elif mode == DEFER:
+                pending.append((file_path, result.content))
+        elif status in (UNCHANGED, CACHED):
+            print(f"- No changes needed for {file_path}", file=log)
+        elif status == ERROR:
+            print(f"Error processing {root_dir / file_path}: {result.detail}", file=log)
+        else:
+            print(f"✗ File not found: {file_path}", file=log)
+
+    if pending:
+        if counts[ERROR]:
+            print(f"\n⚠️ Not writing {len(pending)} fixed files because {counts[ERROR]} files failed", file=log)
+            counts[FIXED] = 0
+        else:
+            for file_path, error in write_batch(root_dir, pending, fsync_each):
+                print(f"Error writing {root_dir / file_path}: {error}", file=log)
+                counts[FIXED] -= 1
+                counts[ERROR] += 1
+    if args.fsync == 'end' and counts[FIXED] and not read_only:
+        os.sync()
+    wall_seconds = time.perf_counter() - start
+
+    # --dry-run and --check leave the tree exactly as they found it
+    if not args.no_cache and not read_only:
+        try:
+            save_cache(cache_file, cache)
+        except OSError as e:
+            print(f"⚠️ Could not write cache {cache_file}: {e}", file=log)
+
+    fixed_count = counts[FIXED]
+    if read_only:
+        print(f"\n{'❌' if fixed_count else '✅'} {fixed_count} files would be changed", file=log)
+    else:
+        print(f"\n✅ Processed {fixed_count} files with fixes", file=log)
+    print(f"   {counts[UNCHANGED]} unchanged, {counts[CACHED]} cached, "
+          f"{counts[ERROR]} errors, {counts[NOT_FOUND]} not found", file=log)
+    if args.converge:
+        passes = ', '.join(f"{count} in {number}" for number, count in sorted(pass_counts.items()))
+        print(f"   Files by passes needed: {passes or 'none'}", file=log)
+        if unsettled:
+            print(f"⚠️ {len(unsettled)} files still changing after {max_passes} passes:", file=log)
+            for file_path in unsettled:
+                print(f"   {file_path}", file=log)
+
+    if profiling:
+        summary = profile_summary(profiles, wall_seconds)
+        if args.profile:
+            print_profile(summary, log)
+        if args.profile_json:
+            with open(args.profile_json, 'w', encoding='utf-8') as f:
+                json.dump(summary, f, indent=2)
+    if slowest:
+        try:
+            written = write_cprofiles(Path(args.cprofile_dir), slowest)
+        except OSError as e:
+            print(f"⚠️ Could not write cProfile output to {args.cprofile_dir}: {e}", file=log)
         else:
-            print(f"✗ File not found: {file_path}")
+            print(f"\n📊 cProfile stats for the {len(written)} slowest files in {args.cprofile_dir} "
+                  f"(python -m pstats <file>)", file=log)
 
-    print(f"\n✅ Processed {fixed_count} files with fixes")
-    return fixed_count
+    if counts[ERROR] or (args.check and fixed_count):
+        return 1
+    return 0
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+In-page accessibility audit for the UI test scripts
+Collects every check in a single evaluate call, however large the page is
+"""
+
+# Everything is gathered in the page and returned as one plain object:
+#   focusOrder        first `maxFocus` elements in keyboard tab order
+#   skipLink          whether a skip-navigation link exists
+#   lowContrast       text elements with their own background below 4.5:1
+#   unlabeledInputs   placeholder (or null) of inputs without a label
+#   imagesMissingAlt  src of images with an empty or missing alt
+#   headings          level and text of every heading, in document order
+AUDIT_JS = """(maxFocus) => {
+    const textOf = el => (el.innerText || '').substring(0, 30);
+
+    // Tab order: positive tabindex first (ascending), then tabindex 0 in DOM order
+    const focusable = Array.from(document.querySelectorAll(
+        'a[href], button, input, select, textarea, summary, [tabindex], [contenteditable="true"]'
+    )).filter(el => el.tabIndex >= 0 && !el.disabled && !el.closest('[inert]')
+        && el.getClientRects().length > 0 && getComputedStyle(el).visibility !== 'hidden');
+    const positive = focusable.filter(el => el.tabIndex > 0).sort((a, b) => a.tabIndex - b.tabIndex);
+    const focusOrder = positive.concat(focusable.filter(el => el.tabIndex === 0))
+        .slice(0, maxFocus)
+        .map(el => ({
+            tag: el.tagName,
+            text: textOf(el),
+            ariaLabel: el.getAttribute('aria-label'),
+            role: el.getAttribute('role')
+        }));
+
+    const luminance = (r, g, b) => {
+        const [rs, gs, bs] = [r, g, b].map(c => {
+            c = c / 255;
+            return c <= 0.03928 ? c / 12.92 : Math.pow((c + 0.055) / 1.055, 2.4);
+        });
+        return 0.2126 * rs + 0.7152 * gs + 0.0722 * bs;
+    };
+    const contrastRatio = (color1, color2) => {
+        const l1 = luminance(...color1);
+        const l2 = luminance(...color2);
+        return (Math.max(l1, l2) + 0.05) / (Math.min(l1, l2) + 0.05);
+    };
+    const lowContrast = [];
+    for (const el of document.querySelectorAll('p, h1, h2, h3, h4, h5, h6, a, button')) {
+        const style = getComputedStyle(el);
+        const bgColor = style.backgroundColor;
+        // Skip if colors can't be determined
+        if (!style.color || !bgColor || bgColor === 'rgba(0, 0, 0, 0)') continue;
+        const colorMatch = style.color.match(/\\d+/g);
+        const bgMatch = bgColor.match(/\\d+/g);
+        if (!colorMatch || !bgMatch) continue;
+        const ratio = contrastRatio(colorMatch.slice(0, 3).map(Number), bgMatch.slice(0, 3).map(Number));
+        if (ratio < 4.5) {
+            lowContrast.push({ text: textOf(el), ratio: ratio.toFixed(2), element: el.tagName });
+        }
+    }
+
+    const unlabeledInputs = Array.from(document.querySelectorAll('input, textarea, select'))
+        .filter(el => !((el.id && document.querySelector(`label[for="${CSS.escape(el.id)}"]`))
+            || el.getAttribute('aria-label') || el.getAttribute('aria-labelledby')))
+        .map(el => el.getAttribute('placeholder'));
+
+    const imagesMissingAlt = Array.from(document.images)
+        .filter(img => !img.getAttribute('alt'))
+        .map(img => img.getAttribute('src'));
+
+    const headings = Array.from(document.querySelectorAll('h1, h2, h3, h4, h5, h6')).map(h => ({
+        level: parseInt(h.tagName[1]),
+        text: h.innerText.substring(0, 30)
+    }));
+
+    return {
+        focusOrder,
+        skipLink: !!document.querySelector("a[href='#main'], a[href='#content'], .skip-navigation"),
+        lowContrast,
+        unlabeledInputs,
+        imagesMissingAlt,
+        headings
+    };
+}"""
+
+
+def audit_accessibility(page, max_focus=20):
+    """Run the whole audit in one round trip and return its report dict"""
+    return page.evaluate(AUDIT_JS, max_focus)
+
+
+def heading_hierarchy_issues(headings):
+    """Skipped heading levels, such as ``H2 → H4``"""
+    issues = []
+    last_level = 0
+    for heading in headings:
+        if heading['level'] > last_level + 1 and last_level > 0:
+            issues.append(f"H{last_level} → H{heading['level']}")
+        last_level = heading['level']
+    return issues
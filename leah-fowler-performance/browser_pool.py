@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Shared Playwright browser for the UI test scripts
+Launches Chromium once per run and hands each suite its own isolated context
+"""
+
+import queue
+import socket
+import threading
+from contextlib import contextmanager
+from playwright.async_api import async_playwright
+from playwright.sync_api import sync_playwright
+
+# Precise heap sizes for web_vitals rather than coarse buckets
+LAUNCH_ARGS = ['--enable-precise-memory-info']
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+class BrowserPool:
+    """One Chromium process shared by every suite in a run
+
+    Each suite gets a fresh browser context, so cookies, storage and
+    viewport settings never leak between suites, without paying for a
+    browser launch per suite. Chromium is started on first use. Only an
+    ``attachable`` pool opens a DevTools port for other threads to attach()
+    to, since any local process could drive the browser through it.
+    """
+
+    def __init__(self, headless=False, attachable=False):
+        self.headless = headless
+        self.attachable = attachable
+        self.browser = None
+        self.port = None
+        self._playwright = None
+
+    def start(self):
+        if self.browser is None:
+            args = list(LAUNCH_ARGS)
+            if self.attachable:
+                self.port = _free_port()
+                args.append(f'--remote-debugging-port={self.port}')
+            self._playwright = sync_playwright().start()
+            self.browser = self._playwright.chromium.launch(headless=self.headless, args=args)
+        return self
+
+    def close(self):
+        if self.browser is not None:
+            self.browser.close()
+            self.browser = None
+        if self._playwright is not None:
+            self._playwright.stop()
+            self._playwright = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @contextmanager
+    def context(self, **options):
+        """A new browser context, closed again when the block exits"""
+        context = self.start().browser.new_context(**options)
+        try:
+            yield context
+        finally:
+            context.close()
+
+    @contextmanager
+    def page(self, **options):
+        """A page in its own new context; ``options`` go to new_context()"""
+        with self.context(**options) as context:
+            yield context.new_page()
+
+    @contextmanager
+    def attach(self):
+        """A pool for the calling thread that drives this pool's browser
+
+        Playwright's sync API is tied to the thread that started it, so
+        worker threads connect to the shared Chromium over CDP rather than
+        launching their own. Each still starts its own Playwright driver, a
+        Node process, which is why map() attaches once per thread rather
+        than per item. The pool must be ``attachable`` and started in its
+        own thread first.
+        """
+        if not self.attachable:
+            raise RuntimeError("Only a BrowserPool(attachable=True) can be attached to from other threads")
+        if self.port is None:
+            raise RuntimeError("BrowserPool must be started before other threads attach to it")
+        with sync_playwright() as playwright:
+            worker = BrowserPool(self.headless, attachable=True)
+            worker.port = self.port
+            worker.browser = playwright.chromium.connect_over_cdp(f'http://127.0.0.1:{self.port}')
+            try:
+                yield worker
+            finally:
+                worker.close()  # only disconnects; the browser belongs to this pool
+
+    def map(self, func, items, workers=4):
+        """``func(worker, item)`` for each item, across ``workers`` threads
+
+        Each thread attaches to this pool once and takes items from a queue
+        until none are left, so at most ``workers`` pages are busy at a
+        time. Results come back in the order of ``items``; an item whose
+        call raised gets the exception in place of its result. The pool must
+        be ``attachable``.
+        """
+        if not self.attachable:
+            raise RuntimeError("BrowserPool.map() needs a BrowserPool(attachable=True)")
+        items = list(items)
+        jobs = queue.Queue()
+        for index in range(len(items)):
+            jobs.put(index)
+        results = [None] * len(items)
+        self.start()
+
+        def work():
+            try:
+                with self.attach() as worker:
+                    while True:
+                        try:
+                            index = jobs.get_nowait()
+                        except queue.Empty:
+                            return
+                        try:
+                            results[index] = func(worker, items[index])
+                        except Exception as e:
+                            results[index] = e
+            except Exception as e:
+                # Could not attach: fail whatever this thread would have taken
+                while True:
+                    try:
+                        results[jobs.get_nowait()] = e
+                    except queue.Empty:
+                        return
+
+        threads = [threading.Thread(target=work, daemon=True) for _ in range(min(max(workers, 1), len(items)))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+
+class AsyncBrowserPool:
+    """The shared Chromium for a run driven from an asyncio event loop
+
+    Playwright's sync API refuses to start inside a running event loop, so
+    this launches the browser with the async API instead. Suites still use
+    the sync API, from threads or processes that connect to its DevTools
+    ``port`` over CDP exactly as they would to an attachable BrowserPool.
+    """
+
+    def __init__(self, headless=False):
+        self.headless = headless
+        self.attachable = True
+        self.browser = None
+        self.port = None
+        self._playwright = None
+
+    async def start(self):
+        if self.browser is None:
+            self.port = _free_port()
+            self._playwright = await async_playwright().start()
+            self.browser = await self._playwright.chromium.launch(
+                headless=self.headless, args=[*LAUNCH_ARGS, f'--remote-debugging-port={self.port}'])
+        return self
+
+    async def close(self):
+        if self.browser is not None:
+            await self.browser.close()
+            self.browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    attach = BrowserPool.attach
+
+
+@contextmanager
+def browser_session(pool=None, headless=False, attachable=False):
+    """Use ``pool`` if one is given, otherwise a private pool for the block
+
+    Lets every suite run on its own or share a pool with the others. A
+    suite that attaches worker threads asks for an ``attachable`` pool.
+    """
+    if pool is not None:
+        yield pool
+        return
+    with BrowserPool(headless=headless, attachable=attachable) as own_pool:
+        yield own_pool
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Clipped and overflowing text detector for the UI debug scripts
+Walks the DOM once in the page and sends back only compact findings
+"""
+
+# Default cap on findings returned from the page
+DEFAULT_LIMIT = 50
+
+# One TreeWalker pass over the elements under <body>. Only elements with
+# their own text are checked, and computed styles and rects are cached per
+# node, so the ancestors shared by many text elements are looked up once.
+# Findings are filtered in the page and capped at `limit`.
+SCAN_JS = """({ needles, exact, limit, textLength }) => {
+    const styles = new Map();
+    const rects = new Map();
+    const styleOf = el => {
+        let style = styles.get(el);
+        if (!style) styles.set(el, style = getComputedStyle(el));
+        return style;
+    };
+    const rectOf = el => {
+        let rect = rects.get(el);
+        if (!rect) rects.set(el, rect = el.getBoundingClientRect());
+        return rect;
+    };
+    const outside = (inner, outer) => inner.left < outer.left - 0.5 || inner.right > outer.right + 0.5
+        || inner.top < outer.top - 0.5 || inner.bottom > outer.bottom + 0.5;
+    const clips = style => style.overflowX !== 'visible' || style.overflowY !== 'visible';
+
+    const skip = new Set(['SCRIPT', 'STYLE', 'NOSCRIPT', 'TEMPLATE']);
+    const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_ELEMENT, {
+        acceptNode: el => skip.has(el.tagName) ? NodeFilter.FILTER_REJECT : NodeFilter.FILTER_ACCEPT
+    });
+    const exactTexts = new Set(exact);
+    const results = [];
+    let scanned = 0, matched = 0;
+
+    for (let el = walker.currentNode; el; el = walker.nextNode()) {
+        scanned++;
+        let text = '';
+        for (const node of el.childNodes) {
+            if (node.nodeType === Node.TEXT_NODE) text += node.data;
+        }
+        text = text.trim();
+        if (!text) continue;
+        const isExact = exactTexts.has(text);
+        if (!isExact && needles.length && !needles.some(needle => text.includes(needle))) continue;
+
+        const style = styleOf(el);
+        const rect = rectOf(el);
+        const reasons = [];
+        if (el.getClientRects().length) {
+            if (clips(style) && (el.scrollWidth > el.clientWidth || el.scrollHeight > el.clientHeight)) {
+                reasons.push('overflow-hidden');
+            }
+            if (style.textOverflow === 'ellipsis') reasons.push('ellipsis');
+            if (rect.top < 0 || rect.left < 0 || rect.right > window.innerWidth) reasons.push('offscreen');
+            if (parseFloat(style.fontSize) > rect.height) reasons.push('short-box');
+            const parent = el.parentElement;
+            if (parent && (rect.right > rectOf(parent).right + 0.5 || rect.bottom > rectOf(parent).bottom + 0.5)) {
+                reasons.push('overflows-parent');
+            }
+            // The nearest ancestor that clips decides what actually shows
+            for (let ancestor = parent; ancestor && ancestor !== document.body; ancestor = ancestor.parentElement) {
+                if (!clips(styleOf(ancestor))) continue;
+                if (outside(rect, rectOf(ancestor))) {
+                    reasons.push(`clipped-by:${ancestor.tagName.toLowerCase()}${ancestor.id ? '#' + ancestor.id : ''}`);
+                }
+                break;
+            }
+        }
+        if (!reasons.length && !isExact) continue;
+
+        matched++;
+        if (results.length >= limit) continue;
+        results.push({
+            tag: el.tagName,
+            text: text.substring(0, textLength),
+            className: (el.getAttribute('class') || '').substring(0, 80),
+            id: el.id,
+            exact: isExact,
+            reasons,
+            rect: {
+                top: Math.round(rect.top),
+                left: Math.round(rect.left),
+                width: Math.round(rect.width),
+                height: Math.round(rect.height)
+            },
+            style: {
+                display: style.display,
+                visibility: style.visibility,
+                opacity: style.opacity,
+                position: style.position,
+                overflow: style.overflow,
+                fontSize: style.fontSize,
+                lineHeight: style.lineHeight
+            }
+        });
+    }
+    return { scanned, matched, truncated: matched > results.length, results };
+}"""
+
+
+def scan_clipping(page, needles=(), exact=(), limit=DEFAULT_LIMIT, text_length=40):
+    """Find text that may be clipped, in one pass and one round trip
+
+    Elements whose own text contains one of ``needles`` (any text if there
+    are none) are reported when they look clipped; elements whose whole
+    text is in ``exact`` are always reported. Returns a dict with the
+    counts ``scanned`` and ``matched``, ``truncated`` and at most ``limit``
+    ``results``, each listing the ``reasons`` it was flagged.
+    """
+    return page.evaluate(SCAN_JS, {
+        'needles': list(needles),
+        'exact': list(exact),
+        'limit': limit,
+        'textLength': text_length,
+    })
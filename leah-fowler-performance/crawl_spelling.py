@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Site-wide UK spelling crawl for Leah Fowler Performance
+Renders every route once per build, caches its visible text and runs the
+spelling dictionary over the cache, so changing the dictionary needs no
+browser at all
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import urllib.request
+import xml.etree.ElementTree as ET
+from urllib.parse import urlsplit
+
+from spelling_audit import (BASE_URL, REQUIRED_UK_TERMS, UK_US_TERMS, SpellingAuditor, found, is_uk_consistent,
+                            load_terms)
+
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app")
+BUILD_ID_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".next", "BUILD_ID")
+CACHE_PATH = ".spelling-cache.json"
+
+# Used when there is no production build; `next dev` recompiles on every
+# change, so pass --refresh after editing copy
+DEV_BUILD_ID = "development"
+
+SITEMAP_NS = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+
+
+def app_routes(app_dir=APP_DIR, skip=("admin", "test")):
+    """Static routes of the Next.js app router, from its page.tsx files
+
+    Route groups such as ``(marketing)`` add no path segment, private
+    ``_folders`` and dynamic ``[param]`` routes are left out, as are the
+    top-level sections in ``skip``.
+    """
+    routes = []
+    for directory, dirnames, filenames in os.walk(app_dir):
+        dirnames[:] = sorted(name for name in dirnames
+                             if not name.startswith(("_", "[", "@")) and name != "api")
+        if not any(name in filenames for name in ("page.tsx", "page.jsx", "page.ts", "page.js")):
+            continue
+        parts = [part for part in os.path.relpath(directory, app_dir).split(os.sep)
+                 if part != "." and not (part.startswith("(") and part.endswith(")"))]
+        if parts and parts[0] in skip:
+            continue
+        routes.append("/" + "/".join(parts))
+    return sorted(routes)
+
+
+def sitemap_routes(base_url=BASE_URL, timeout=10):
+    """Paths listed in the running site's /sitemap.xml"""
+    with urllib.request.urlopen(base_url.rstrip("/") + "/sitemap.xml", timeout=timeout) as response:
+        root = ET.fromstring(response.read())
+    routes = []
+    for loc in root.iter(SITEMAP_NS + "loc"):
+        path = urlsplit(loc.text.strip()).path or "/"
+        if path not in routes:
+            routes.append(path)
+    return routes
+
+
+def build_id(path=BUILD_ID_PATH):
+    """The current Next.js build ID, or DEV_BUILD_ID without a build"""
+    try:
+        with open(path) as f:
+            return f.read().strip() or DEV_BUILD_ID
+    except FileNotFoundError:
+        return DEV_BUILD_ID
+
+
+class TextCache:
+    """Visible page text keyed by build ID and URL, kept in a JSON file
+
+    Text cached under another build is stale and is dropped on load.
+    """
+
+    def __init__(self, path, build):
+        self.path = path
+        self.build = build
+        self.pages = {}
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return
+        if data.get("build_id") == build:
+            self.pages = data.get("pages", {})
+
+    def __contains__(self, url):
+        return url in self.pages
+
+    def __getitem__(self, url):
+        return self.pages[url]
+
+    def __setitem__(self, url, text):
+        self.pages[url] = text
+
+    def save(self):
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w") as f:
+            json.dump({"build_id": self.build, "pages": self.pages}, f)
+        os.replace(temp_path, self.path)
+
+
+def visible_text(pool, url):
+    """Rendered text of the page at ``url``, extracted in one call"""
+    with pool.page() as page:
+        page.goto(url)
+        page.wait_for_load_state("networkidle")
+        return page.inner_text("body")
+
+
+def fill_cache(cache, urls, pages=4, headless=True):
+    """Render the ``urls`` missing from ``cache``; returns {url: error}"""
+    missing = [url for url in urls if url not in cache]
+    if not missing:
+        return {}
+    # Only a cache miss needs Playwright at all
+    from browser_pool import BrowserPool
+
+    errors = {}
+    with BrowserPool(headless=headless, attachable=True) as pool:
+        for url, text in zip(missing, pool.map(visible_text, missing, pages)):
+            if isinstance(text, Exception):
+                errors[url] = str(text)[:200]
+                print(f"  ❌ {url}: {errors[url]}", flush=True)
+            else:
+                cache[url] = text
+                print(f"  📄 {url}", flush=True)
+    return errors
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Check every route of the site for US spellings")
+    parser.add_argument("routes", nargs="*", metavar="ROUTE",
+                        help="paths to check (default: every route found with --source)")
+    parser.add_argument("--source", choices=("app", "sitemap"), default="app",
+                        help="find routes from the app/ directory or the site's sitemap.xml (default: app)")
+    parser.add_argument("--base-url", default=BASE_URL, help=f"site to crawl (default: {BASE_URL})")
+    parser.add_argument("--terms", metavar="JSON", help="UK → US term dictionary to use instead of the built-in one")
+    parser.add_argument("-p", "--pages", type=int, default=4,
+                        help="how many pages may render at once (default: 4)")
+    parser.add_argument("--cache", default=CACHE_PATH, help=f"page text cache file (default: {CACHE_PATH})")
+    parser.add_argument("--build-id", help="cache under this build ID instead of the one in .next/BUILD_ID")
+    parser.add_argument("--refresh", action="store_true", help="render every page again, ignoring the cache")
+    parser.add_argument("--json", dest="json_path", metavar="PATH", help="also write the per-route results as JSON")
+    parser.add_argument("--headed", action="store_true", help="show the Chromium window")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.routes:
+        routes = [route if route.startswith("/") else "/" + route for route in args.routes]
+    elif args.source == "sitemap":
+        try:
+            routes = sitemap_routes(args.base_url)
+        except (OSError, ET.ParseError) as e:
+            print(f"❌ Could not read the sitemap: {e}")
+            return 1
+    else:
+        routes = app_routes()
+    base_url = args.base_url.rstrip("/")
+    urls = {route: base_url + route for route in routes}
+
+    build = args.build_id or build_id()
+    cache = TextCache(args.cache, build)
+    if args.refresh:
+        cache.pages = {}
+    cached = sum(url in cache for url in urls.values())
+    print(f"🔍 {len(routes)} routes, {cached} cached for build {build}")
+
+    errors = fill_cache(cache, list(urls.values()), max(args.pages, 1), not args.headed)
+    cache.save()
+
+    start = time.perf_counter()
+    auditor = SpellingAuditor(load_terms(args.terms) if args.terms else UK_US_TERMS)
+    results = {route: auditor.audit(cache[url]) for route, url in urls.items() if url in cache}
+    elapsed = time.perf_counter() - start
+
+    print("\n📊 Spelling by route")
+    for route, counts in results.items():
+        us_terms = found(counts, "us")
+        print(f"  {'⚠️' if us_terms else '✅'} {route}")
+        if us_terms:
+            print(f"      US terms found: {us_terms}")
+    for route, url in urls.items():
+        if url in errors:
+            print(f"  ❌ {route}: not rendered")
+
+    # Required UK terms only need to appear somewhere on the site
+    site = {"uk": {term: sum(counts["uk"][term] for counts in results.values()) for term in auditor.terms},
+            "us": {term: sum(counts["us"][term] for counts in results.values()) for term in auditor.terms}}
+    consistent = is_uk_consistent(site, [term for term in REQUIRED_UK_TERMS if term in auditor.terms])
+    print(f"\n{'✅' if consistent else '⚠️'} UK English consistency across {len(results)} pages "
+          f"(audited in {elapsed * 1000:.1f} ms)")
+    if not consistent:
+        print("    UK terms found:", found(site, "uk"))
+        print("    US terms found:", found(site, "us"))
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump({"build_id": build, "base_url": base_url, "site": site, "routes": results,
+                       "errors": {route: errors[url] for route, url in urls.items() if url in errors}},
+                      f, indent=2)
+
+    return 0 if consistent and not errors else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Clipped-text sweep across routes and viewports
+Crawls every route at every viewport with a bounded pool of pages and
+writes the clipping findings as one JSON report
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime, timezone
+
+from browser_pool import BrowserPool
+from clip_detector import DEFAULT_LIMIT, scan_clipping
+from viewports import VIEWPORTS, context_options, label, parse_viewport
+from wait_helpers import wait_for_page_settled
+
+BASE_URL = "http://localhost:3004"
+
+
+def scan_route(pool, base_url, route, viewport, needles, exact, limit):
+    """Load ``route`` at ``viewport`` in a fresh context and scan it once"""
+    start = time.perf_counter()
+    with pool.page(**context_options(viewport)) as page:
+        response = page.goto(base_url.rstrip("/") + route)
+        page.wait_for_load_state("networkidle")
+        wait_for_page_settled(page)
+        scan = scan_clipping(page, needles=needles, exact=exact, limit=limit)
+    scan["status"] = response.status if response else None
+    scan["seconds"] = round(time.perf_counter() - start, 2)
+    return scan
+
+
+def crawl(pool, base_url, routes, viewports, pages=4, needles=(), exact=(), limit=DEFAULT_LIMIT):
+    """Scan every (route, viewport) pair, at most ``pages`` at a time
+
+    Returns ``{route: {viewport label: scan}}`` in the order given; a pair
+    that failed holds ``{"error": message}`` instead of a scan.
+    """
+    def scan(worker, job):
+        route, viewport = job
+        try:
+            result = scan_route(worker, base_url, route, viewport, needles, exact, limit)
+        except Exception as e:
+            result = {"error": str(e)[:200]}
+        mark = "❌" if "error" in result else "🔴" if result["matched"] else "✅"
+        print(f"  {mark} {route} @ {label(viewport)}", flush=True)
+        return result
+
+    jobs = [(route, viewport) for route in routes for viewport in viewports]
+    findings = dict(zip(jobs, pool.map(scan, jobs, pages)))
+    return {route: {label(viewport): _as_finding(findings[route, viewport]) for viewport in viewports}
+            for route in routes}
+
+
+def _as_finding(result):
+    # A worker that could not attach leaves its exception in place of a scan
+    return {"error": str(result)[:200]} if isinstance(result, Exception) else result
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Find clipped or overflowing text across routes and viewports")
+    parser.add_argument("routes", nargs="*", default=["/"], metavar="ROUTE",
+                        help="paths to check, such as /apply (default: /)")
+    parser.add_argument("-v", "--viewport", dest="viewports", action="append", type=parse_viewport,
+                        metavar="VIEWPORT",
+                        help="viewport name or WIDTHxHEIGHT[@SCALEx]; repeat for several "
+                             f"(default: {', '.join(v.name for v in VIEWPORTS)})")
+    parser.add_argument("--base-url", default=BASE_URL, help=f"site to crawl (default: {BASE_URL})")
+    parser.add_argument("-p", "--pages", type=int, default=4,
+                        help="how many pages may be open at once (default: 4)")
+    parser.add_argument("--needle", dest="needles", action="append", default=[],
+                        help="only check text containing this; repeat for several (default: all text)")
+    parser.add_argument("--exact", action="append", default=[],
+                        help="always report elements whose whole text is this")
+    parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT,
+                        help=f"most findings kept per page (default: {DEFAULT_LIMIT})")
+    parser.add_argument("-o", "--output", default="clipped-text-report.json",
+                        help="where to write the JSON report (default: clipped-text-report.json)")
+    parser.add_argument("--strict", action="store_true", help="exit 1 when anything is clipped")
+    parser.add_argument("--headed", action="store_true", help="show the Chromium window")
+    args = parser.parse_args(argv)
+    args.viewports = args.viewports or VIEWPORTS
+    args.routes = [route if route.startswith("/") else "/" + route for route in args.routes]
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    print(f"🔍 Scanning {len(args.routes)} routes at {len(args.viewports)} viewports")
+
+    start = time.perf_counter()
+    # The browser is started in this thread; the workers attach to it
+    with BrowserPool(headless=not args.headed, attachable=True) as pool:
+        routes = crawl(pool, args.base_url, args.routes, args.viewports, max(args.pages, 1),
+                       args.needles, args.exact, args.limit)
+    elapsed = time.perf_counter() - start
+
+    scans = [scan for viewports in routes.values() for scan in viewports.values()]
+    errors = sum("error" in scan for scan in scans)
+    clipped = sum(scan.get("matched", 0) for scan in scans)
+    report = {
+        "generated": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "base_url": args.base_url,
+        "viewports": {label(v): v._asdict() for v in args.viewports},
+        "needles": args.needles,
+        "exact": args.exact,
+        "seconds": round(elapsed, 2),
+        "summary": {"pages": len(scans), "errors": errors, "findings": clipped},
+        "routes": routes,
+    }
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\n📄 Report saved as {args.output}")
+    print(f"⏱️ {len(scans)} pages in {elapsed:.1f}s: {clipped} findings, {errors} errors")
+
+    if errors or (args.strict and clipped):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Concurrent runner for the Leah Fowler Performance UI suites
+Runs independent suites side by side in separate contexts of one browser
+"""
+
+import argparse
+import asyncio
+import os
+import signal
+import sys
+import time
+from collections import namedtuple
+
+from browser_pool import AsyncBrowserPool, BrowserPool
+import test_ui
+import test_ui_final
+
+# (name, title, suite) in report order; every suite takes a BrowserPool
+SUITES = [
+    ("assessment", "Assessment Tool", test_ui.test_assessment_tool),
+    ("responsive", "Responsive Design", test_ui.test_responsive_design),
+    ("accessibility", "Accessibility", test_ui.test_accessibility),
+    ("interactive", "Interactive Components", test_ui.test_interactive_components),
+    ("enhancements", "Final Enhancements", test_ui_final.test_enhancements),
+]
+
+PASSED = "passed"
+FAILED = "failed"
+TIMED_OUT = "timed out"
+
+SuiteResult = namedtuple("SuiteResult", "name title status seconds output error")
+
+
+async def _drain(stream, chunks):
+    while chunk := await stream.read(1 << 16):
+        chunks.append(chunk)
+
+
+async def run_suite(pool, semaphore, suite, timeout):
+    """Run one suite in a child process attached to the shared browser
+
+    A process rather than a thread, because sync Playwright calls cannot be
+    interrupted: a suite over ``timeout`` seconds is killed along with its
+    Playwright driver, which drops its CDP connection, and Chromium closes
+    the contexts it opened. Every child starts its own Playwright driver (a
+    Node process), so only ``concurrency`` of them run at a time.
+    """
+    name, title, _ = suite
+    async with semaphore:
+        start = time.perf_counter()
+        proc = await asyncio.create_subprocess_exec(
+            sys.executable, "-u", os.path.abspath(__file__), "--attach", str(pool.port), name,
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+            env={**os.environ, "PYTHONIOENCODING": "utf-8"}, start_new_session=True)
+        output, errors = [], []
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(_drain(proc.stdout, output), _drain(proc.stderr, errors), proc.wait()), timeout)
+            status = PASSED if proc.returncode == 0 else FAILED
+        except asyncio.TimeoutError:
+            status = TIMED_OUT
+        finally:
+            if proc.returncode is None:
+                # The child's whole session, so the driver it started goes too
+                os.killpg(proc.pid, signal.SIGKILL)
+                await proc.wait()
+        # Anything still in the pipes when it was killed
+        output.append(await proc.stdout.read())
+        errors.append(await proc.stderr.read())
+        error = None
+        if status == FAILED:
+            lines = b"".join(errors).decode("utf-8", "replace").strip().splitlines()
+            error = lines[-1] if lines else f"exit status {proc.returncode}"
+        return SuiteResult(name, title, status, time.perf_counter() - start,
+                           b"".join(output).decode("utf-8", "replace"), error)
+
+
+def run_attached(name, port):
+    """The child process side of run_suite(): one suite on the browser at ``port``
+
+    Returns the exit status; a failure is reported as the last line on stderr.
+    """
+    func = next(func for suite_name, _, func in SUITES if suite_name == name)
+    pool = BrowserPool(attachable=True)
+    pool.port = port
+    try:
+        with pool.attach() as worker:
+            func(worker)
+    except Exception as e:
+        print(f"{type(e).__name__}: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+async def run_suites(pool, suites, concurrency=2, timeout=300):
+    """Run ``suites`` at most ``concurrency`` at a time, reporting in order
+
+    Each suite's output is held back and printed as one block once it and
+    every suite before it have finished, so the log reads the same as a
+    sequential run. A suite over ``timeout`` seconds is stopped and
+    reported as timed out, freeing its place for the next one.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    tasks = [asyncio.create_task(run_suite(pool, semaphore, suite, timeout)) for suite in suites]
+    results = []
+    for task in tasks:
+        result = await task
+        sys.stdout.write(result.output)
+        if result.status == FAILED:
+            sys.stdout.write(f"\n❌ Error in {result.title} test: {str(result.error)[:100]}\n")
+        elif result.status == TIMED_OUT:
+            sys.stdout.write(f"\n⏱️ {result.title} test timed out after {timeout}s\n")
+        sys.stdout.flush()
+        results.append(result)
+    return results
+
+
+async def run_in_browser(suites, concurrency=2, timeout=300, headless=False):
+    """Launch the shared browser in this event loop and run_suites() in it"""
+    async with AsyncBrowserPool(headless=headless) as pool:
+        return await run_suites(pool, suites, concurrency, timeout)
+
+
+def parse_args(argv=None):
+    names = [name for name, _, _ in SUITES]
+    parser = argparse.ArgumentParser(description="Run the UI suites concurrently against one browser")
+    parser.add_argument("suites", nargs="*", metavar="SUITE",
+                        help=f"suites to run (default: all of {', '.join(names)})")
+    parser.add_argument("-c", "--concurrency", type=int, default=3,
+                        help="how many suites may run at once (default: 3)")
+    parser.add_argument("--timeout", type=float, default=300,
+                        help="seconds before a suite is reported as timed out (default: 300)")
+    parser.add_argument("--headless", action="store_true", help="run Chromium without a window")
+    # Set by run_suite() for the child process running one suite
+    parser.add_argument("--attach", type=int, metavar="PORT", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.suites if name not in names]
+    if unknown:
+        parser.error(f"unknown suite: {', '.join(unknown)}")
+    if args.attach is not None and len(args.suites) != 1:
+        parser.error("--attach runs exactly one suite")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.attach is not None:
+        return run_attached(args.suites[0], args.attach)
+    suites = [suite for suite in SUITES if not args.suites or suite[0] in args.suites]
+
+    start = time.perf_counter()
+    results = asyncio.run(run_in_browser(suites, max(args.concurrency, 1), args.timeout, args.headless))
+    elapsed = time.perf_counter() - start
+
+    print("\n" + "=" * 50)
+    print("📊 Suite Summary")
+    print("=" * 50)
+    for result in results:
+        icon = {PASSED: "✅", FAILED: "❌", TIMED_OUT: "⏱️"}[result.status]
+        print(f"  {icon} {result.title:<25} {result.status:<10} {result.seconds:6.1f}s")
+    print(f"\n⏱️ Wall time {elapsed:.1f}s vs {sum(r.seconds for r in results):.1f}s of suite time")
+
+    return 0 if all(result.status == PASSED for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+UK/US spelling audit for the UI test scripts
+Scans the visible text of a page once for every term in the dictionary
+"""
+
+import argparse
+import json
+import re
+import sys
+
+# UK spelling → US spelling; inflected forms (analysed, programmes,
+# optimisation, ...) are matched and counted under these headwords
+UK_US_TERMS = {
+    "optimise": "optimize",
+    "programme": "program",
+    "personalise": "personalize",
+    "analyse": "analyze",
+    "organise": "organize",
+    "prioritise": "prioritize",
+    "specialise": "specialize",
+    "recognise": "recognize",
+    "behaviour": "behavior",
+    "colour": "color",
+    "centre": "center",
+}
+
+# Headwords the site copy is expected to use at least once
+REQUIRED_UK_TERMS = ("optimise", "programme", "personalise", "analyse")
+
+BASE_URL = "http://localhost:3004"
+
+
+def word_forms(word):
+    """``word`` and its common inflections, such as optimise → optimised"""
+    if word.endswith("e"):
+        stem = word[:-1]
+        return [word, stem + "es", stem + "ed", stem + "ing", stem + "ation", stem + "ations"]
+    return [word, word + "s", word + "ed", word + "ing"]
+
+
+def doubled_forms(word):
+    """Inflections of ``word`` with its final consonant doubled
+
+    US English does this for some words only (program → programmed,
+    programming), so these forms are never counted as US evidence; they
+    just mark matching UK forms as ambiguous.
+    """
+    if re.search(r"[aeiou][^aeiouwxy]$", word):
+        return [word + word[-1] + "ed", word + word[-1] + "ing"]
+    return []
+
+
+def load_terms(path):
+    """A UK → US term dictionary from a JSON object file"""
+    with open(path) as f:
+        terms = json.load(f)
+    if not isinstance(terms, dict) or not all(isinstance(v, str) for v in terms.values()):
+        raise ValueError(f"{path}: expected a JSON object of UK spelling to US spelling")
+    return terms
+
+
+class SpellingAuditor:
+    """Counts UK and US spellings of ``terms`` with one compiled pattern
+
+    Every form of every term goes into a single case-insensitive
+    alternation anchored on word boundaries, so each text is scanned once
+    and "program" never matches inside "programme".
+    """
+
+    def __init__(self, terms=UK_US_TERMS):
+        self.terms = dict(terms)
+        owners = {}
+        for uk, us in self.terms.items():
+            for variant, word in (("uk", uk), ("us", us)):
+                for form in word_forms(word.lower()):
+                    owners.setdefault(form, set()).add((variant, uk))
+        for uk, us in self.terms.items():
+            for form in doubled_forms(us.lower()):
+                if form in owners:
+                    owners[form].add(("us", uk))
+        # A form shared by two spellings proves nothing either way
+        self._forms = {form: owner.pop() for form, owner in owners.items() if len(owner) == 1}
+        forms = sorted(self._forms, key=len, reverse=True)
+        self._pattern = re.compile(r"\b(?:%s)\b" % "|".join(map(re.escape, forms)), re.IGNORECASE)
+
+    def audit(self, text):
+        """``{"uk": {term: count}, "us": {term: count}}`` keyed by UK headword"""
+        counts = {"uk": dict.fromkeys(self.terms, 0), "us": dict.fromkeys(self.terms, 0)}
+        for match in self._pattern.finditer(text):
+            variant, term = self._forms[match.group().lower()]
+            counts[variant][term] += 1
+        return counts
+
+    def audit_page(self, page):
+        """Audit the rendered, visible text of ``page``"""
+        return self.audit(page.inner_text("body"))
+
+    def audit_routes(self, page, routes, base_url=BASE_URL):
+        """``{route: audit}`` for each route, loaded in turn in ``page``"""
+        results = {}
+        for route in routes:
+            page.goto(base_url.rstrip("/") + route)
+            page.wait_for_load_state("networkidle")
+            results[route] = self.audit_page(page)
+        return results
+
+
+def is_uk_consistent(counts, required=REQUIRED_UK_TERMS):
+    """True if every ``required`` UK term appears and no US spelling does"""
+    return all(counts["uk"].get(term) for term in required) and not any(counts["us"].values())
+
+
+def found(counts, variant):
+    """The terms of ``variant`` ("uk" or "us") that appeared, with counts"""
+    return {term: count for term, count in counts[variant].items() if count}
+
+
+def main(argv=None):
+    from browser_pool import BrowserPool
+
+    parser = argparse.ArgumentParser(description="Check pages for US spellings of UK terms")
+    parser.add_argument("routes", nargs="*", default=["/"], metavar="ROUTE",
+                        help="paths to check (default: /)")
+    parser.add_argument("--base-url", default=BASE_URL, help=f"site to check (default: {BASE_URL})")
+    parser.add_argument("--terms", metavar="JSON", help="UK → US term dictionary to use instead of the built-in one")
+    parser.add_argument("--json", dest="json_path", metavar="PATH", help="also write the results as JSON")
+    args = parser.parse_args(argv)
+
+    auditor = SpellingAuditor(load_terms(args.terms) if args.terms else UK_US_TERMS)
+    with BrowserPool(headless=True) as pool, pool.page() as page:
+        results = auditor.audit_routes(page, args.routes, args.base_url)
+
+    for route, counts in results.items():
+        us_terms = found(counts, "us")
+        print(f"{'⚠️' if us_terms else '✅'} {route}")
+        if us_terms:
+            print(f"    US terms found: {us_terms}")
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+
+    return 1 if any(any(counts["us"].values()) for counts in results.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
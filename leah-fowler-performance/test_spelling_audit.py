@@ -0,0 +1,23 @@
+"""Tests for spelling_audit.py (run with pytest)"""
+
+from spelling_audit import SpellingAuditor
+
+
+def test_inflections_count_under_their_headword():
+    counts = SpellingAuditor().audit("We optimised it. Optimization helps. Colours and colors.")
+    assert counts["uk"]["optimise"] == 1
+    assert counts["us"]["optimise"] == 1
+    assert counts["uk"]["colour"] == 1
+    assert counts["us"]["colour"] == 1
+
+
+def test_forms_us_english_shares_are_not_uk_evidence():
+    counts = SpellingAuditor().audit("Programming is programmed. Our programmes, their program.")
+    assert counts["uk"]["programme"] == 1
+    assert counts["us"]["programme"] == 1
+
+
+def test_word_boundaries():
+    counts = SpellingAuditor().audit("programme")
+    assert counts["uk"]["programme"] == 1
+    assert counts["us"]["programme"] == 0
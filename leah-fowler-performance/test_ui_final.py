@@ -4,23 +4,26 @@ Final UI verification test for Leah Fowler Performance Coach Platform
 Confirms all enhancements have been properly implemented
 """
 
-from playwright.sync_api import sync_playwright, expect
-import time
+from playwright.sync_api import expect
 
-def test_enhancements():
+from browser_pool import browser_session
+from spelling_audit import SpellingAuditor, found, is_uk_consistent
+from web_vitals import instrument, record_vitals, vitals_summary
+from wait_helpers import wait_for_hash, wait_for_scroll_settled, wait_for_transitions
+
+def test_enhancements(pool=None):
     """Test that all UI enhancements are working properly"""
     
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(viewport={'width': 1920, 'height': 1080})
-        page = context.new_page()
+    with browser_session(pool) as session, session.page(viewport={'width': 1920, 'height': 1080}) as page:
         
         print("🎯 Final UI Enhancement Verification")
         print("=" * 50)
         
         # Navigate to the application
+        instrument(page)
         page.goto("http://localhost:3004")
         page.wait_for_load_state("networkidle")
+        print(f"⏱️ {vitals_summary(record_vitals(page, 'enhancements'))}")
         
         # Test 1: Skip navigation link (accessibility)
         print("\n✅ Testing Accessibility Enhancements:")
@@ -34,7 +37,8 @@ def test_enhancements():
         # Test 2: Smooth scrolling
         print("\n✅ Testing Smooth Scrolling:")
         page.locator("a[href='#assessment']").first.click()
-        time.sleep(1)
+        wait_for_hash(page, "#assessment")
+        wait_for_scroll_settled(page)
         
         # Check if we're at the assessment section
         assessment_visible = page.locator("#assessment").is_visible()
@@ -47,7 +51,7 @@ def test_enhancements():
         cta_button = page.locator("text='Start Your Assessment'").first
         initial_transform = cta_button.evaluate("el => window.getComputedStyle(el).transform")
         cta_button.hover()
-        time.sleep(0.3)
+        wait_for_transitions(cta_button)
         hover_transform = cta_button.evaluate("el => window.getComputedStyle(el).transform")
         has_hover_animation = initial_transform != hover_transform
         print(f"  - CTA button hover animation: {'✅' if has_hover_animation else '⚠️'}")
@@ -58,7 +62,7 @@ def test_enhancements():
         # Click on a rating button
         rating_button = page.locator("button").filter(has_text="8").first
         rating_button.click()
-        time.sleep(0.3)
+        wait_for_transitions(rating_button)
         
         # Check if button has enhanced states
         button_classes = rating_button.get_attribute("class")
@@ -68,7 +72,7 @@ def test_enhancements():
         # Test 5: Form accessibility
         print("\n✅ Testing Form Accessibility:")
         page.goto("http://localhost:3004#contact")
-        time.sleep(1)
+        wait_for_scroll_settled(page)
         
         # Check for form labels
         name_input = page.locator("#contact-name")
@@ -96,57 +100,40 @@ def test_enhancements():
         
         # Test 7: UK English verification
         print("\n✅ Testing UK English:")
-        page_content = page.content()
-        
-        # Check for UK spellings
-        uk_terms = {
-            "optimise": page_content.count("optimise") > 0,
-            "programme": page_content.count("programme") > 0,
-            "personalised": page_content.count("personalised") > 0,
-            "analyse": page_content.count("analyse") > 0
-        }
-        
-        # Check for US spellings (should be 0)
-        us_terms = {
-            "optimize": page_content.count("optimize"),
-            "program": page_content.count("program") - page_content.count("programme"),  # Subtract UK spelling
-            "personalized": page_content.count("personalized"),
-            "analyze": page_content.count("analyze")
-        }
-        
-        uk_english_correct = all(uk_terms.values()) and all(count == 0 for count in us_terms.values())
+        spelling = SpellingAuditor().audit_page(page)
+        uk_english_correct = is_uk_consistent(spelling)
         print(f"  - UK English consistency: {'✅' if uk_english_correct else '⚠️'}")
         
         if not uk_english_correct:
-            print("    UK terms found:", {k: v for k, v in uk_terms.items() if v})
-            print("    US terms found:", {k: v for k, v in us_terms.items() if v > 0})
+            print("    UK terms found:", found(spelling, "uk"))
+            print("    US terms found:", found(spelling, "us"))
         
         # Test 8: Mobile responsiveness
         print("\n✅ Testing Mobile Responsiveness:")
         
         # Switch to mobile viewport
-        mobile_context = browser.new_context(viewport={'width': 375, 'height': 667})
-        mobile_page = mobile_context.new_page()
-        mobile_page.goto("http://localhost:3004")
-        mobile_page.wait_for_load_state("networkidle")
-        
-        # Check if desktop nav is hidden
-        desktop_nav = mobile_page.locator(".hidden.md\\:flex")
-        is_hidden_on_mobile = desktop_nav.count() == 0 or not desktop_nav.is_visible()
-        print(f"  - Desktop nav hidden on mobile: {'✅' if is_hidden_on_mobile else '⚠️'}")
-        
-        # Check if buttons stack vertically
-        hero_buttons = mobile_page.locator(".flex.flex-col.sm\\:flex-row").first
-        flex_direction = hero_buttons.evaluate("el => window.getComputedStyle(el).flexDirection")
-        print(f"  - Buttons stack on mobile: {'✅' if flex_direction == 'column' else '⚠️'}")
-        
-        mobile_context.close()
+        with session.page(viewport={'width': 375, 'height': 667}) as mobile_page:
+            instrument(mobile_page)
+            mobile_page.goto("http://localhost:3004")
+            mobile_page.wait_for_load_state("networkidle")
+            print(f"  - ⏱️ {vitals_summary(record_vitals(mobile_page, 'enhancements'))}")
+            
+            # Check if desktop nav is hidden
+            desktop_nav = mobile_page.locator(".hidden.md\\:flex")
+            is_hidden_on_mobile = desktop_nav.count() == 0 or not desktop_nav.is_visible()
+            print(f"  - Desktop nav hidden on mobile: {'✅' if is_hidden_on_mobile else '⚠️'}")
+            
+            # Check if buttons stack vertically
+            hero_buttons = mobile_page.locator(".flex.flex-col.sm\\:flex-row").first
+            flex_direction = hero_buttons.evaluate("el => window.getComputedStyle(el).flexDirection")
+            print(f"  - Buttons stack on mobile: {'✅' if flex_direction == 'column' else '⚠️'}")
+        
+        # INP needs the clicks and key presses above
+        print(f"\n⏱️ After interactions: {vitals_summary(record_vitals(page, 'enhancements', 'interactions'))}")
         
         # Final screenshot
         page.screenshot(path="final_enhanced_ui.png")
         
-        browser.close()
-        
         print("\n" + "=" * 50)
         print("🎉 UI Enhancement Verification Complete!")
         print("=" * 50)
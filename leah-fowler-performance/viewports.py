@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Viewport matrix shared by the UI test scripts
+Add a Viewport here to have every responsive check cover it
+"""
+
+import argparse
+from collections import namedtuple
+
+# scale_factor is the device pixel ratio (2 for a @2x screen)
+Viewport = namedtuple('Viewport', 'name width height scale_factor', defaults=(1,))
+
+VIEWPORTS = [
+    Viewport('Mobile', 375, 667),
+    Viewport('Mobile HiDPI', 390, 844, 2),  # the profile debug_apply_page.py inspects
+    Viewport('Tablet', 768, 1024),
+    Viewport('Desktop', 1920, 1080),
+]
+
+# Viewports at least this wide are expected to show the desktop navigation
+DESKTOP_MIN_WIDTH = 1024
+
+
+def context_options(viewport):
+    """Keyword arguments for browser.new_context() that emulate ``viewport``"""
+    return {
+        'viewport': {'width': viewport.width, 'height': viewport.height},
+        'device_scale_factor': viewport.scale_factor,
+    }
+
+
+def label(viewport):
+    """Short description such as ``390x844@2x``"""
+    size = f"{viewport.width}x{viewport.height}"
+    return size if viewport.scale_factor == 1 else f"{size}@{viewport.scale_factor:g}x"
+
+
+def slug(viewport):
+    """File-name friendly form of the viewport name"""
+    return viewport.name.lower().replace(' ', '_')
+
+
+def parse_viewport(text):
+    """A Viewport from a name in VIEWPORTS or a size such as ``390x844@2x``
+
+    Meant as an argparse ``type``, so a bad value is an ArgumentTypeError.
+    """
+    for viewport in VIEWPORTS:
+        if viewport.name.lower() == text.lower():
+            return viewport
+    size, _, scale = text.lower().partition('@')
+    width, _, height = size.partition('x')
+    try:
+        return Viewport(text, int(width), int(height), float(scale.rstrip('x')) if scale else 1)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"unknown viewport {text!r}: use a name from VIEWPORTS or WIDTHxHEIGHT[@SCALEx]") from None
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Event-driven waits for the UI test scripts
+Each helper waits for a concrete change in the page instead of sleeping a fixed time
+"""
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+# Milliseconds, like Playwright's own timeouts
+WAIT_TIMEOUT = 5000
+
+# What wait_for_value_change compares, as a JS expression over `el`
+TEXT = "el.innerText"
+WIDTH = "el.style.width"
+
+# Resolves once the scroll position has held still for `frames` animation frames.
+# The deadline is a timer started up front, since requestAnimationFrame may be
+# throttled or paused (e.g. in a background tab) and never call back.
+SCROLL_SETTLED_JS = """([frames, timeout]) => new Promise(resolve => {
+    let last = null, still = 0, expired = false;
+    const timer = setTimeout(() => { expired = true; resolve(false); }, timeout);
+    const tick = () => {
+        if (expired) return;
+        const position = `${window.scrollX},${window.scrollY}`;
+        still = position === last ? still + 1 : 0;
+        last = position;
+        if (still >= frames) { clearTimeout(timer); resolve(true); }
+        else requestAnimationFrame(tick);
+    };
+    requestAnimationFrame(tick);
+})"""
+
+# Resolves once every finite animation or transition under `root` is done;
+# styles changed by the last input only apply on the next frame. As above,
+# the timer starts before waiting for that frame.
+ANIMATIONS_DONE_JS = """(root, timeout) => new Promise(resolve => {
+    const timer = setTimeout(() => resolve(false), timeout);
+    requestAnimationFrame(() => {
+        const animations = root === document
+            ? document.getAnimations()
+            : root.getAnimations({ subtree: true });
+        const running = animations
+            .filter(animation => animation.effect?.getComputedTiming().iterations !== Infinity)
+            .map(animation => animation.finished.catch(() => null));
+        Promise.all(running).then(() => { clearTimeout(timer); resolve(true); });
+    });
+})"""
+
+
+def read_value(page, selector, read=TEXT):
+    """Current value of ``read`` for the first element matching ``selector``"""
+    return page.evaluate(f"selector => {{ const el = document.querySelector(selector); return el && ({read}); }}",
+                         selector)
+
+
+def wait_for_value_change(page, selector, previous, read=TEXT, timeout=WAIT_TIMEOUT):
+    """Wait until ``read`` on ``selector`` differs from ``previous``
+
+    An element that has gone away counts as changed, so this also works on
+    the step that replaces it. Returns False if nothing changed in time.
+    """
+    script = (f"([selector, previous]) => {{ const el = document.querySelector(selector); "
+              f"return !el || ({read}) !== previous; }}")
+    try:
+        page.wait_for_function(script, arg=[selector, previous], timeout=timeout)
+        return True
+    except PlaywrightTimeoutError:
+        return False
+
+
+def wait_for_text_change(page, selector, previous, timeout=WAIT_TIMEOUT):
+    """Wait for an element's text to change, e.g. the next assessment question"""
+    return wait_for_value_change(page, selector, previous, TEXT, timeout)
+
+
+def wait_for_width_change(page, selector, previous, timeout=WAIT_TIMEOUT):
+    """Wait for an element's inline width to change, e.g. a progress bar"""
+    return wait_for_value_change(page, selector, previous, WIDTH, timeout)
+
+
+def wait_for_hash(page, expected_hash, timeout=WAIT_TIMEOUT):
+    """Wait until the URL fragment is ``expected_hash`` (such as ``#contact``)"""
+    try:
+        page.wait_for_function("hash => window.location.hash === hash", arg=expected_hash, timeout=timeout)
+        return True
+    except PlaywrightTimeoutError:
+        return False
+
+
+def wait_for_scroll_settled(page, frames=3, timeout=WAIT_TIMEOUT):
+    """Wait until smooth scrolling has stopped; False if it kept moving"""
+    return page.evaluate(SCROLL_SETTLED_JS, [frames, timeout])
+
+
+def wait_for_transitions(locator, timeout=WAIT_TIMEOUT):
+    """Wait for transitions and animations on an element and its children to end"""
+    return locator.evaluate(ANIMATIONS_DONE_JS, timeout)
+
+
+def wait_for_page_settled(page, timeout=WAIT_TIMEOUT):
+    """Wait for web fonts and every finite animation on the page
+
+    Looping animations are ignored, since they never finish.
+    """
+    return page.evaluate(f"timeout => document.fonts.ready.then(() => ({ANIMATIONS_DONE_JS})(document, timeout))",
+                         timeout)
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Web vitals and navigation timing capture for the UI test scripts
+Turns every page the suites load into a performance sample, one JSON Lines
+file per viewport under perf-results/
+"""
+
+import json
+import os
+import threading
+from datetime import datetime, timezone
+
+from viewports import Viewport, label
+
+RESULTS_DIR = "perf-results"
+
+# Groups the samples written by one run of the scripts
+RUN_ID = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+# Installed before any page script runs, so nothing is missed. Observers
+# keep the entries the Performance timeline itself does not buffer
+VITALS_INIT_JS = """(() => {
+    if (window.__webVitals) return;
+    const vitals = window.__webVitals = { lcp: null, shifts: [], longTasks: [], events: [] };
+    const observe = (type, callback, options = {}) => {
+        try {
+            new PerformanceObserver(list => list.getEntries().forEach(callback))
+                .observe({ type, buffered: true, ...options });
+        } catch (e) {
+            // Entry type not supported by this browser
+        }
+    };
+    observe('largest-contentful-paint', entry => { vitals.lcp = entry.startTime; });
+    observe('layout-shift', entry => {
+        if (!entry.hadRecentInput) vitals.shifts.push([entry.startTime, entry.value]);
+    });
+    observe('longtask', entry => { vitals.longTasks.push([entry.startTime, entry.duration]); });
+    observe('event', entry => {
+        if (entry.interactionId) vitals.events.push([entry.interactionId, entry.duration]);
+    }, { durationThreshold: 16 });
+})()"""
+
+# Reads everything back in one round trip. CLS is the largest session
+# window (gaps under 1s, at most 5s long); INP is the 98th percentile of
+# interaction latencies; TBT counts long-task time past 50ms after FCP
+COLLECT_JS = """(slowest) => {
+    const vitals = window.__webVitals || { lcp: null, shifts: [], longTasks: [], events: [] };
+    const round = value => value == null ? null : Math.round(value * 10) / 10;
+
+    const nav = performance.getEntriesByType('navigation')[0];
+    const fcpEntry = performance.getEntriesByName('first-contentful-paint')[0];
+    const fcp = fcpEntry ? fcpEntry.startTime : null;
+
+    let cls = 0, session = 0, first = 0, last = 0;
+    for (const [start, value] of vitals.shifts) {
+        if (session && start - last < 1000 && start - first < 5000) {
+            session += value;
+        } else {
+            session = value;
+            first = start;
+        }
+        last = start;
+        cls = Math.max(cls, session);
+    }
+
+    const latencies = new Map();
+    for (const [id, duration] of vitals.events) {
+        latencies.set(id, Math.max(latencies.get(id) || 0, duration));
+    }
+    const sorted = Array.from(latencies.values()).sort((a, b) => b - a);
+    const inp = sorted.length ? sorted[Math.min(Math.floor(sorted.length / 50), sorted.length - 1)] : null;
+
+    const tbt = vitals.longTasks
+        .filter(([start]) => fcp === null || start >= fcp)
+        .reduce((total, [, duration]) => total + Math.max(0, duration - 50), 0);
+
+    const resources = performance.getEntriesByType('resource');
+    const byType = {};
+    for (const entry of resources) {
+        const type = byType[entry.initiatorType] ||= { count: 0, transferSize: 0, decodedBodySize: 0 };
+        type.count++;
+        type.transferSize += entry.transferSize;
+        type.decodedBodySize += entry.decodedBodySize;
+    }
+
+    return {
+        url: location.href,
+        devicePixelRatio,
+        ttfb: nav ? round(nav.responseStart) : null,
+        fcp: round(fcp),
+        lcp: round(vitals.lcp),
+        cls: Math.round(cls * 10000) / 10000,
+        inp: round(inp),
+        interactions: latencies.size,
+        tbt: round(tbt),
+        longTasks: vitals.longTasks.length,
+        heap: performance.memory ? {
+            used: performance.memory.usedJSHeapSize,
+            total: performance.memory.totalJSHeapSize,
+            limit: performance.memory.jsHeapSizeLimit
+        } : null,
+        navigation: nav ? {
+            type: nav.type,
+            redirect: round(nav.redirectEnd - nav.redirectStart),
+            dns: round(nav.domainLookupEnd - nav.domainLookupStart),
+            connect: round(nav.connectEnd - nav.connectStart),
+            request: round(nav.responseStart - nav.requestStart),
+            response: round(nav.responseEnd - nav.responseStart),
+            domInteractive: round(nav.domInteractive),
+            domContentLoaded: round(nav.domContentLoadedEventEnd),
+            load: round(nav.loadEventEnd),
+            transferSize: nav.transferSize
+        } : null,
+        resources: {
+            count: resources.length,
+            transferSize: resources.reduce((total, entry) => total + entry.transferSize, 0),
+            byType,
+            slowest: resources
+                .slice()
+                .sort((a, b) => b.duration - a.duration)
+                .slice(0, slowest)
+                .map(entry => ({
+                    name: entry.name,
+                    type: entry.initiatorType,
+                    duration: round(entry.duration),
+                    transferSize: entry.transferSize
+                }))
+        }
+    };
+}"""
+
+_write_lock = threading.Lock()
+
+
+def instrument(page):
+    """Start recording vitals on every document ``page`` loads from now on
+
+    Call before the first page.goto(); pages loaded earlier still report
+    navigation and resource timing, but no LCP, CLS, INP or TBT.
+    """
+    page.add_init_script(VITALS_INIT_JS)
+
+
+def collect_vitals(page, slowest=10):
+    """The current vitals and timings of ``page`` as a plain dict
+
+    Times are milliseconds from the start of navigation. ``inp`` is None
+    until something on the page has been clicked, tapped or typed into.
+    """
+    return page.evaluate(COLLECT_JS, slowest)
+
+
+def _viewport_label(page, device_pixel_ratio=1):
+    """Label such as ``390x844@2x`` for the viewport ``page`` emulates"""
+    size = page.viewport_size or {"width": 0, "height": 0}
+    return label(Viewport("", size["width"], size["height"], device_pixel_ratio))
+
+
+def record_vitals(page, suite, phase="load", directory=RESULTS_DIR):
+    """Collect the vitals of ``page`` and append them to its viewport's file
+
+    Each sample is one line of ``<directory>/<viewport label>.jsonl`` tagged
+    with the run, the suite and the ``phase`` (such as "load" or
+    "interactions"), so successive runs can be compared. Returns the sample.
+    """
+    vitals = collect_vitals(page)
+    viewport = _viewport_label(page, vitals.pop("devicePixelRatio"))
+    sample = {
+        "run": RUN_ID,
+        "time": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "suite": suite,
+        "phase": phase,
+        "viewport": viewport,
+        **vitals,
+    }
+    line = json.dumps(sample) + "\n"
+    # Suites may run side by side in threads and share a viewport file
+    with _write_lock:
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, f"{viewport}.jsonl"), "a") as f:
+            f.write(line)
+    return sample
+
+
+def vitals_summary(sample):
+    """One-line report of the headline numbers in ``sample``"""
+    def ms(value):
+        return "n/a" if value is None else f"{value:.0f}ms"
+
+    heap = sample.get("heap")
+    return (f"TTFB {ms(sample['ttfb'])}, FCP {ms(sample['fcp'])}, LCP {ms(sample['lcp'])}, "
+            f"CLS {sample['cls']:.3f}, INP {ms(sample['inp'])}, TBT {ms(sample['tbt'])}"
+            + (f", heap {heap['used'] / 1048576:.1f}MB" if heap else ""))
@@ -0,0 +1,354 @@
+"""Tests for the source lexer and the CLI of fix-eslint-errors.py (run with pytest)"""
+
+import importlib.util
+import json
+import os
+import random
+import subprocess
+from pathlib import Path
+
+import pytest
+
+FIXER_SCRIPT = Path(__file__).resolve().parent / 'fix-eslint-errors.py'
+
+spec = importlib.util.spec_from_file_location('fix_eslint_errors', FIXER_SCRIPT)
+fixer = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(fixer)
+
+
+def spans(content, jsx=True):
+    """(kind, text) for every span scan_source finds"""
+    return [(kind, content[start:end]) for kind, start, end in fixer.scan_source(content, jsx)]
+
+
+@pytest.mark.parametrize('content', [
+    "const id = <T,>(value: T) => value; const s = 'x'",
+    "function first<T extends unknown[]>(items: T) { return 'x' }",
+    "const pick = <K extends keyof Props>(key: K) => props[key] ?? 'x'",
+    "type Mapper = <T>(item: T) => T\nconst s = 'x'",
+    "interface P { render: <T>(x: T) => string }\nconst s = 'x'",
+    "type Fold = <T>(\n  items: T[],\n  step: (acc: T) => T,\n) => T\nconst s = 'x'",
+])
+def test_generic_parameters_are_not_jsx(content):
+    assert spans(content) == [(fixer.STRING, "'x'")]
+
+
+def test_generic_function_types_keep_strings_intact():
+    content = ("type Mapper = <T>(item: T) => T\n"
+               "const msg = \"don't\"\n"
+               "const y = require('y')\n")
+    assert fixer.fix_content(content, 'lib/map.tsx') == ("type Mapper = <T>(item: T) => T\n"
+                                                         "const msg = \"don't\"\n"
+                                                         "import y from 'y'\n")
+
+
+def test_element_followed_by_parenthesis_is_jsx():
+    assert spans("const a = <b>(optional)</b>") == [(fixer.JSX_TEXT, '(optional)')]
+
+
+def test_jsx_elements_and_fragments():
+    content = "const a = <div className='x'>It's {name}</div>\nconst b = <>Don't</>"
+    assert spans(content) == [
+        (fixer.STRING, "'x'"),
+        (fixer.JSX_TEXT, "It's "),
+        (fixer.JSX_TEXT, "Don't"),
+    ]
+
+
+def test_nested_and_self_closing_elements():
+    content = "return (\n  <ul>\n    <li key={id}>A</li>\n    <br />\n  </ul>\n)\nconst s = 'x'"
+    assert [kind for kind, _ in spans(content)] == [fixer.JSX_TEXT] * 4 + [fixer.STRING]
+    assert spans(content)[-1] == (fixer.STRING, "'x'")
+
+
+def test_no_jsx_in_plain_typescript():
+    content = "const n = <number>value; const s = 'it'"
+    assert spans(content, jsx=False) == [(fixer.STRING, "'it'")]
+
+
+def test_comparison_is_not_jsx():
+    assert spans("if (a <b) { c = 'x' }") == [(fixer.STRING, "'x'")]
+
+
+@pytest.mark.parametrize('content, regex', [
+    ("const r = /ab+c/gi.test(s)", '/ab+c/gi'),
+    ("return /[/]'/.test(s)", "/[/]'/"),
+    ("if (ok) {}\n/x/.test(s)", '/x/'),
+    ("const f = (s) => s.replace(/'/g, '')", "/'/g"),
+])
+def test_regex_literals(content, regex):
+    assert (fixer.REGEX, regex) in spans(content)
+
+
+@pytest.mark.parametrize('content', [
+    "const half = total / 2 / count",
+    "const ratio = (a + b) / c",
+    "const x = items[0] / scale",
+    "const y = value /* per */ / 2",
+])
+def test_division_is_not_a_regex(content):
+    assert fixer.REGEX not in [kind for kind, _ in spans(content)]
+
+
+def test_template_substitutions_nest():
+    content = "const s = `a ${ {b: 'c'}.b } d ${`inner ${x}`} e`; const t = 'y'"
+    assert spans(content) == [
+        (fixer.TEMPLATE, 'a '),
+        (fixer.STRING, "'c'"),
+        (fixer.TEMPLATE, ' d '),
+        (fixer.TEMPLATE, 'inner '),
+        (fixer.TEMPLATE, ' e'),
+        (fixer.STRING, "'y'"),
+    ]
+
+
+def test_template_without_substitutions():
+    assert spans("const s = `it's ${''}`\nconst t = `plain`") == [
+        (fixer.TEMPLATE, "it's "),
+        (fixer.STRING, "''"),
+        (fixer.TEMPLATE, 'plain'),
+    ]
+
+
+def test_jsx_inside_template_substitution_and_back():
+    content = "const s = `${cond ? <b>Don't</b> : ''}'`"
+    assert spans(content) == [(fixer.JSX_TEXT, "Don't"), (fixer.STRING, "''"), (fixer.TEMPLATE, "'")]
+
+
+def test_comments_hide_quotes_and_slashes():
+    content = "// it's\n/* don't / */ const s = 'x'"
+    assert spans(content) == [(fixer.COMMENT, "// it's"), (fixer.COMMENT, "/* don't / */"), (fixer.STRING, "'x'")]
+
+
+def test_unterminated_tokens_end_the_file():
+    assert spans("const s = 'abc\nnext") == [(fixer.STRING, "'abc")]
+    assert spans("/* open") == [(fixer.COMMENT, '/* open')]
+    assert spans("`open ${a}") == [(fixer.TEMPLATE, 'open ')]
+
+
+def test_kind_at():
+    content = "const s = 'x' // c"
+    tokens = fixer.TokenSpans(fixer.scan_source(content))
+    assert tokens.kind_at(0) == fixer.CODE
+    assert tokens.kind_at(content.index("'")) == fixer.STRING
+    assert tokens.kind_at(content.index('//') + 3) == fixer.COMMENT
+    assert list(tokens.code_ranges(len(content))) == [(0, 10), (13, 14)]
+
+
+# Pieces for random sources, chosen to hit every mode switch
+PIECES = ['<', '>', '/', "'", '"', '`', '${', '{', '}', '(', ')', '=', ',', ' ', '\n', '\n  ', 'a', 'x / y',
+          '/re[/]g', 'return ', '<div>', '</div>', '<>', '</>', '<T,>', '<T\nextends ', "don't", '//', '/*', '*/',
+          '<T>(', ') => ', 'x: T']
+
+
+def test_relex_matches_a_fresh_lex():
+    rng = random.Random(0)
+    for _ in range(3000):
+        content = ''.join(rng.choice(PIECES) for _ in range(rng.randint(0, 50)))
+        jsx = rng.random() < 0.8
+        edits, pos = [], 0
+        for _ in range(rng.randint(1, 4)):
+            if pos > len(content):
+                break
+            start = rng.randint(pos, len(content))
+            end = min(len(content), start + rng.choice([0, 1, 3, 8]))
+            replacement = ''.join(rng.choice(PIECES) for _ in range(rng.randint(0 if end > start else 1, 3)))
+            edits.append((start, end, replacement))
+            pos = end + 1
+        result = fixer.apply_edits(content, edits)
+        relexed = fixer.relex(fixer.lex_source(content, jsx), content, result, edits, jsx)
+        fresh = fixer.lex_source(result, jsx)
+        assert (relexed.spans, relexed.marks) == (fresh.spans, fresh.marks), (content, edits)
+
+
+def test_fixers_share_one_lex(monkeypatch):
+    calls = []
+    lex_source = fixer.lex_source
+    monkeypatch.setattr(fixer, 'lex_source', lambda content, jsx=True: calls.append(1) or lex_source(content, jsx))
+    content = ("const label = 'x: any'\n"
+               "export const C = () => <p onClick={(e: any) => go(e)}>It's</p>\n"
+               "useEffect(() => {}, [])\n")
+    fixer.clear_source_cache()
+    result = fixer.fix_content(content, 'components/C.tsx')
+    assert result == ("const label = 'x: any'\n"
+                      "export const C = () => <p onClick={(e: unknown) => go(e)}>It&apos;s</p>\n"
+                      "// eslint-disable-next-line react-hooks/exhaustive-deps\n"
+                      "useEffect(() => {}, [])\n")
+    # Later fixers relexed around the earlier ones' edits
+    assert len(calls) == 1
+
+
+def write_report(tmp_path, messages):
+    """An `eslint --format json` report for {file name: [(rule id, line)]}"""
+    report = tmp_path / 'report.json'
+    report.write_text(json.dumps([
+        {'filePath': str(tmp_path / name), 'messages': [{'ruleId': rule_id, 'line': line} for rule_id, line in found]}
+        for name, found in messages.items()
+    ]))
+    return str(report)
+
+
+def run_fixer(tmp_path, *args):
+    return fixer.main(['--root', str(tmp_path), '-j', '1', *args])
+
+
+def test_eslint_targets_keep_fixable_rules_and_lines(tmp_path):
+    results = [
+        {'filePath': str(tmp_path / 'a.ts'), 'messages': [
+            {'ruleId': 'prefer-const', 'line': 2},
+            {'ruleId': 'prefer-const', 'line': 5, 'endLine': 6},
+            {'ruleId': 'no-undef', 'line': 1},
+            {'ruleId': '@typescript-eslint/no-explicit-any'},
+        ]},
+        {'filePath': str(tmp_path / 'b.ts'), 'messages': [{'ruleId': 'no-undef', 'line': 1}]},
+        {'filePath': '/elsewhere/c.ts', 'messages': [{'ruleId': 'prefer-const', 'line': 1}]},
+    ]
+    targets = list(fixer.eslint_targets(results, tmp_path))
+    assert [file_path for file_path, _ in targets] == ['a.ts', '/elsewhere/c.ts']
+    selection = targets[0][1]
+    assert set(selection) == {'prefer_const', 'any_types'}
+    assert selection['any_types'] is None
+    assert [line in selection['prefer_const'] for line in range(1, 8)] == [False, True, False, False, True, True, False]
+
+
+def test_eslint_json_fixes_only_reported_lines(tmp_path):
+    (tmp_path / 'a.ts').write_text('let fid = 1\nlet shifts = 2\n')
+    report = write_report(tmp_path, {'a.ts': [('prefer-const', 2)]})
+    assert run_fixer(tmp_path, '--eslint-json', report) == 0
+    assert (tmp_path / 'a.ts').read_text() == 'let fid = 1\nconst shifts = 2\n'
+
+
+def test_cache_skips_unchanged_files_until_they_change(tmp_path, capsys):
+    source = tmp_path / 'a.ts'
+    source.write_text('let fid = 1\n')
+    report = write_report(tmp_path, {'a.ts': [('prefer-const', 1)]})
+    run_fixer(tmp_path, '--eslint-json', report)
+    assert source.read_text() == 'const fid = 1\n'
+    capsys.readouterr()
+
+    run_fixer(tmp_path, '--eslint-json', report)
+    assert '0 unchanged, 1 cached' in capsys.readouterr().out
+
+    source.write_text('let fid = 2\n')
+    run_fixer(tmp_path, '--eslint-json', report)
+    assert source.read_text() == 'const fid = 2\n'
+    assert '0 cached' in capsys.readouterr().out
+
+
+def test_cache_from_other_rules_is_discarded(tmp_path):
+    cache_file = tmp_path / fixer.CACHE_FILE
+    cache_file.write_text(json.dumps({'version': 'other', 'files': {'a.ts': 'x'}}))
+    assert fixer.load_cache(cache_file) == {}
+    fixer.save_cache(cache_file, {'a.ts': 'x'})
+    assert fixer.load_cache(cache_file) == {'a.ts': 'x'}
+
+
+def test_check_exit_status_and_writes_nothing(tmp_path):
+    source = tmp_path / 'a.ts'
+    source.write_text('let fid = 1\n')
+    report = write_report(tmp_path, {'a.ts': [('prefer-const', 1)]})
+    assert run_fixer(tmp_path, '--eslint-json', report, '--check') == 1
+    assert source.read_text() == 'let fid = 1\n'
+    assert not (tmp_path / fixer.CACHE_FILE).exists()
+
+    source.write_text('const fid = 1\n')
+    assert run_fixer(tmp_path, '--eslint-json', report, '--check') == 0
+
+
+def git(tmp_path, *args):
+    subprocess.run(['git', '-C', str(tmp_path), '-c', 'user.name=test', '-c', 'user.email=test@example.com', *args],
+                   check=True, capture_output=True)
+
+
+@pytest.mark.parametrize('option', ['--changed', '--staged'])
+def test_changed_and_staged_limit_the_targets(tmp_path, option):
+    for name in ('a.ts', 'b.ts', 'c.ts'):
+        (tmp_path / name).write_text('let fid = 1\n')
+    git(tmp_path, 'init', '-q')
+    git(tmp_path, 'add', '.')
+    git(tmp_path, 'commit', '-q', '-m', 'initial')
+    (tmp_path / 'b.ts').write_text('let fid = 2\n')
+    (tmp_path / 'c.ts').write_text('let fid = 3\n')
+    git(tmp_path, 'add', 'c.ts')
+    report = write_report(tmp_path, {name: [('prefer-const', 1)] for name in ('a.ts', 'b.ts', 'c.ts')})
+
+    assert run_fixer(tmp_path, '--eslint-json', report, '--no-cache', option) == 0
+    fixed = {path.name for path in tmp_path.glob('*.ts') if path.read_text().startswith('const')}
+    assert fixed == ({'b.ts', 'c.ts'} if option == '--changed' else {'c.ts'})
+
+
+def test_write_atomic_through_symlink(tmp_path):
+    target = tmp_path / 'real.ts'
+    target.write_text('old')
+    target.chmod(0o640)
+    link = tmp_path / 'link.ts'
+    link.symlink_to(target)
+    fixer.write_atomic(link, 'new')
+    assert link.is_symlink()
+    assert target.read_text() == 'new'
+    assert os.stat(target).st_mode & 0o777 == 0o640
+
+
+def test_line_ranges_follow_removed_and_inserted_lines():
+    before = 'a\nb\nc\nd\ne\n'
+    edits = [(2, 4, ''), (6, 6, 'x\ny\n')]  # drop line 2, insert two lines before line 4
+    after = fixer.apply_edits(before, edits)
+    assert after == 'a\nc\nx\ny\nd\ne\n'
+    old, new = fixer.LineIndex(before), fixer.LineIndex(after)
+    assert repr(fixer.LineRanges([(1, 1), (3, 3), (5, 5)]).shifted(old, new, edits)) == 'LineRanges([(1, 2), (6, 6)])'
+    assert repr(fixer.LineRanges([(2, 2), (4, 4)]).shifted(old, new, edits)) == 'LineRanges([(5, 5)])'
+    assert repr(fixer.LineRanges([(3, 4)]).shifted(old, new, edits)) == 'LineRanges([(2, 5)])'
+
+
+def test_selection_follows_lines_removed_by_earlier_fixers():
+    content = ("import { X } from 'lucide-react'\n"
+               "import { Y } from 'lucide-react'\n"
+               "const fixme: any = 1\n"
+               "const keep: any = 2 // eslint-disable-line @typescript-eslint/no-explicit-any\n"
+               "let fid = 1\n"
+               "let shifts = 2\n")
+    selection = {
+        'unused_imports': fixer.LineRanges([(1, 1)]),
+        'any_types': fixer.LineRanges([(3, 3)]),
+        'prefer_const': fixer.LineRanges([(5, 5)]),
+    }
+    assert fixer.fix_content(content, 'components/ChatWidget.tsx', selection) == (
+        "import { Y } from 'lucide-react'\n"
+        "const fixme: unknown = 1\n"
+        "const keep: any = 2 // eslint-disable-line @typescript-eslint/no-explicit-any\n"
+        "const fid = 1\n"
+        "let shifts = 2\n")
+
+
+def test_out_of_range_matches_are_not_lexed(monkeypatch):
+    monkeypatch.setattr(fixer, 'lex_source', lambda *args: pytest.fail('lexed for out-of-range matches'))
+    fixer.clear_source_cache()
+    content = "let fid = 1\nconst a: any = 2\n"
+    selection = {'prefer_const': fixer.LineRanges([(5, 5)]), 'any_types': fixer.LineRanges([(7, 7)])}
+    assert fixer.fix_content(content, 'lib/a.ts', selection) == content
+
+
+def test_later_passes_see_shifted_lines():
+    content = ("useEffect(() => {\n"
+               "  go()\n"
+               "}, [])\n"
+               "const X = require('lucide-react')\n")
+    selection = {
+        'unused_imports': fixer.LineRanges([(4, 4)]),
+        'require_imports': fixer.LineRanges([(4, 4)]),
+        'hook_dependencies': fixer.LineRanges([(3, 3)]),
+    }
+    # The require becomes an unused import only after the hook fixer has
+    # pushed it down a line, so the second pass must look at line 5
+    assert fixer.converge(content, 'components/ChatWidget.tsx', selection, max_passes=3) == (
+        ("useEffect(() => {\n"
+         "  go()\n"
+         "// eslint-disable-next-line react-hooks/exhaustive-deps\n"
+         "}, [])\n"), 2, True)
+
+
+def test_max_passes_requires_converge(capsys):
+    with pytest.raises(SystemExit):
+        fixer.parse_args(['--max-passes', '3'])
+    assert '--max-passes requires --converge' in capsys.readouterr().err
+    assert fixer.parse_args(['--converge', '--max-passes', '3']).max_passes == 3